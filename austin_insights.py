@@ -16,6 +16,10 @@ Usage:
     html_snippet = format_for_dashboard_tab2(insights)
     # write html_snippet to weekly_tab2_insights.html in ARTIFACT_DIR
 
+Pass ``cache_dir`` (e.g. ARTIFACT_DIR / 'insights_cache') to reuse insights
+for inputs that have already been processed; entries are keyed on a hash of
+the input frames, the week number and INSIGHTS_CACHE_VERSION.
+
 The generator expects DataFrames with at least these columns:
     style_color, sales_dollars, sales_units, on_hand_units,
     sell_through_pct, avg_retail, category
@@ -25,11 +29,84 @@ that the deep‑dive functions know how to segment the data.  If 'category' is
 missing, all rows are treated as Modular.
 """
 
+import hashlib
+import json
+import re
+from pathlib import Path
+from types import SimpleNamespace
 from typing import Dict, List
 import pandas as pd
 import numpy as np
 
 
+# Mixed into the insights cache key; bump whenever the insight logic or the
+# shape of the insights dict changes so stale cache entries stop matching
+INSIGHTS_CACHE_VERSION = 3
+
+# Columns aggregated once per frame for the Total / Modular / Seasonal splits
+STAT_COLUMNS = ['sales_dollars', 'sales_units', 'on_hand_units', 'sell_through_pct', 'avg_retail']
+
+# Every column the generator reads; anything else is dropped on entry
+INPUT_COLUMNS = ['style_color', *STAT_COLUMNS, 'category']
+
+# Columns aggregated per style tag for the callouts
+TAG_STAT_COLUMNS = ['sales_dollars', 'on_hand_units', 'sell_through_pct']
+
+# Style tags used by the callouts, each the union of its (upper‑case) tokens
+STYLE_TAGS = {
+    'work_pant': ('11874',),
+    'duck_pant': ('EU1939',),
+    'cargo_pant': ('GP338',),
+    'double_knee': ('GP738',),
+    'hi_vis': ('HI-?VIS', 'HIVS'),
+    'headwear': ('HEAD', 'CAP', 'HAT'),
+    'head_cap': ('HEAD', 'CAP'),
+    'outerwear': ('JACKET', 'SHACKET', 'COAT'),
+    'shacket': ('SHACKET',),
+    'mechanic': ('MECHANIC', 'IKE'),
+    'graphic_tee': ('GRAPHIC', 'TEE'),
+    'black': ('BK', 'BLACK'),
+}
+
+# Color codes in priority order: when several appear, the earliest entry wins
+COLOR_NAMES = {
+    'BK': 'Black', 'NV': 'Navy', 'KH': 'Khaki',
+    'CH': 'Charcoal', 'RB': 'Rinsed Black',
+    'BD': 'Brown Duck', 'BN': 'Brown',
+}
+_COLOR_PRIORITY = {code: i for i, code in enumerate(COLOR_NAMES)}
+# Lookahead so overlapping codes (e.g. RB and BK in 'RBK') are all found
+_COLOR_RE = re.compile('(?=(' + '|'.join(COLOR_NAMES) + '))')
+
+# '+' prefix for non-negative YoY figures, keyed by the (yoy >= 0) bool (Python
+# or NumPy); NaN compares False and gets no sign, like the old conditional
+_SIGNS = {True: '+', False: ''}
+
+# Tags that require all of their component tags
+COMPOUND_TAGS = {
+    'black_shacket': ('shacket', 'black'),
+}
+_TAG_TOKENS = sorted({token for tokens in STYLE_TAGS.values() for token in tokens})
+
+# Each token owns one bit; a tag's mask is the OR of its tokens' bits
+_TAG_BITS = {
+    tag: sum(1 << _TAG_TOKENS.index(token) for token in tokens)
+    for tag, tokens in STYLE_TAGS.items()
+}
+
+# Plain substrings are matched with numpy.char.find; only the true patterns
+# (e.g. HI-?VIS) go through the regex engine.
+_LITERAL_TOKENS = {token for token in _TAG_TOKENS if re.escape(token) == token}
+
+# One alternation for the pattern tokens.  Each branch sits in a zero‑width
+# lookahead so overlapping tokens are all reported, one named group per token.
+_TAG_RE = re.compile(
+    '(?=' + '|'.join(
+        f'(?P<t{i}>{token})' for i, token in enumerate(_TAG_TOKENS) if token not in _LITERAL_TOKENS
+    ) + ')'
+)
+
+
 class DashboardInsightsGenerator:
     """
     Generate Austin‑style insights formatted for dashboard Tab 2.
@@ -39,9 +116,14 @@ class DashboardInsightsGenerator:
     produces narrative callouts for key styles, and suggests action items.
     """
 
-    def __init__(self):
+    def __init__(self, cache_dir: str = None):
         # Track positive streaks across weeks (not yet used but reserved for future use)
         self.streak_tracker = {}
+        # Optional content‑addressed cache of generated insights (one JSON per input hash)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        # Sorted upper‑case style codes seen so far and their packed tag bits
+        self._tag_vocab = np.array([], dtype=str)
+        self._tag_vocab_bits = np.array([], dtype=np.uint32)
 
     def generate_weekly_insights(
         self,
@@ -62,93 +144,298 @@ class DashboardInsightsGenerator:
             - action_items: list of dicts describing recommended next actions
         """
 
-        # Calculate totals
-        current_totals = self._calculate_totals(current_week_df)
-        ly_totals = self._calculate_totals(ly_week_df)
+        current_week_df = self._project_columns(current_week_df)
+        ly_week_df = self._project_columns(ly_week_df)
 
-        return {
+        cache_path = None
+        if self.cache_dir is not None:
+            cache_key = self._cache_key(current_week_df, ly_week_df, week_number)
+            cache_path = self.cache_dir / f"{cache_key}.json"
+            if cache_path.exists():
+                with cache_path.open('r', encoding='utf-8') as f:
+                    return json.load(f)
+
+        current_week_df = self._coerce_dtypes(current_week_df)
+        ly_week_df = self._coerce_dtypes(ly_week_df)
+
+        # Split and aggregate each frame once; every section reads from these
+        current = self._prepare_frame(current_week_df)
+        ly = self._prepare_frame(ly_week_df)
+
+        insights = {
             'week': week_number,
-            'header_metrics': self._generate_header_metrics(
-                current_totals, ly_totals, current_week_df, ly_week_df
-            ),
-            'big_picture': self._generate_big_picture(current_totals, ly_totals),
-            'modular_deep_dive': self._generate_modular_insights(
-                current_week_df, ly_week_df, week_number
-            ),
-            'seasonal_spotlight': self._generate_seasonal_insights(
-                current_week_df, ly_week_df, previous_week_df
-            ),
-            'action_items': self._generate_action_items(
-                current_week_df, ly_week_df, current_totals, ly_totals
-            ),
+            'header_metrics': self._generate_header_metrics(current['stats'], ly['stats']),
+            'big_picture': self._generate_big_picture(current['stats']['total'], ly['stats']['total']),
+            'modular_deep_dive': self._generate_modular_insights(current, ly, week_number),
+            'seasonal_spotlight': self._generate_seasonal_insights(current, ly, previous_week_df),
+            'action_items': self._generate_action_items(current, ly),
         }
 
+        if cache_path is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with cache_path.open('w', encoding='utf-8') as f:
+                json.dump(insights, f, default=_json_scalar)
+        return insights
+
     # -------------------------------------------------------------------------
-    # Totals and header metrics
+    # Insights cache
     # -------------------------------------------------------------------------
 
-    def _calculate_totals(self, df: pd.DataFrame) -> Dict:
-        """Calculate total business metrics across all styles."""
+    @staticmethod
+    def _cache_key(current_df: pd.DataFrame, ly_df: pd.DataFrame, week_number: int) -> str:
+        """
+        Hash the (projected) inputs into a cache key.  Row contents go through
+        pandas' vectorized hash_pandas_object; column names and the week number
+        are mixed in so differently shaped inputs never collide, and
+        INSIGHTS_CACHE_VERSION so a logic change never serves old insights.
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"v{INSIGHTS_CACHE_VERSION}|".encode('utf-8'))
+        for df in (current_df, ly_df):
+            digest.update('|'.join(map(str, df.columns)).encode('utf-8'))
+            digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+        digest.update(str(week_number).encode('utf-8'))
+        return digest.hexdigest()
+
+    # -------------------------------------------------------------------------
+    # Frame preparation
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _project_columns(df: pd.DataFrame) -> pd.DataFrame:
+        """Keep only INPUT_COLUMNS so every later mask and sum streams less data."""
+        return df[[col for col in INPUT_COLUMNS if col in df.columns]]
+
+    @staticmethod
+    def _coerce_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Store the low‑cardinality string columns (category, style_color) as
+        pandas categoricals so string work runs once per distinct value and
+        row‑level comparisons run on the integer codes.
+        """
+        converted = {
+            col: df[col].astype('category')
+            for col in ('category', 'style_color')
+            if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype)
+        }
+        return df.assign(**converted) if converted else df
+
+    def _prepare_frame(self, df: pd.DataFrame) -> Dict:
+        """
+        Build the per‑frame context shared by every section of the report.
+
+        The category column is lower‑cased once and turned into Modular and
+        Seasonal masks; the subsets and their aggregates are materialized here
+        so the helpers never re-filter or re-sum the full frame.
+        """
+        if 'category' in df.columns:
+            lower_cat = self._lower_category(df['category'])
+            mask_mod = np.asarray(lower_cat == 'modular')
+            mask_seas = np.asarray(lower_cat == 'seasonal')
+        else:
+            # No category column: everything is Modular, nothing is Seasonal
+            mask_mod = np.ones(len(df), dtype=bool)
+            mask_seas = np.zeros(len(df), dtype=bool)
+
+        tags = self._tag_style_colors(df)
+        modular = df[mask_mod]
+        modular_tags = {tag: mask[mask_mod] for tag, mask in tags.items()}
+        seasonal = df[mask_seas]
+        seasonal_tags = {tag: mask[mask_seas] for tag, mask in tags.items()}
         return {
-            'total_sales': df['sales_dollars'].sum(),
-            'total_units': df['sales_units'].sum(),
-            'total_oh': df['on_hand_units'].sum(),
-            'avg_st': df['sell_through_pct'].mean(),
-            'avg_retail': df['avg_retail'].mean(),
+            'df': df,
+            'mask_mod': mask_mod,
+            'mask_seas': mask_seas,
+            'sales_order': self._sales_order(df['sales_dollars'].to_numpy(dtype=float)),
+            'tags': tags,
+            'tag_stats': self._precompute_tag_stats(df, tags),
+            'modular': modular,
+            'modular_tags': modular_tags,
+            'modular_tag_stats': self._precompute_tag_stats(modular, modular_tags),
+            'seasonal': seasonal,
+            'seasonal_tags': seasonal_tags,
+            'seasonal_tag_stats': self._precompute_tag_stats(seasonal, seasonal_tags),
+            'stats': self._precompute_category_stats(df, modular, seasonal),
         }
 
-    def _generate_header_metrics(
-        self,
-        current: Dict,
-        ly: Dict,
-        current_df: pd.DataFrame,
-        ly_df: pd.DataFrame,
-    ) -> Dict:
+    @staticmethod
+    def _sales_order(sales: np.ndarray) -> np.ndarray:
         """
-        Build the top‑level metrics displayed in the header cards of Tab 2.
+        Positions of the non‑missing sales, largest first.  The sort is stable
+        so ties keep frame order, matching nlargest/idxmax.
+        """
+        valid = np.flatnonzero(~np.isnan(sales))
+        return valid[np.argsort(-sales[valid], kind='stable')]
 
-        Each section (total, modular, seasonal) contains absolute metrics and
-        year‑over‑year (YoY) changes.  Sell‑through is averaged across items.
+    @staticmethod
+    def _lower_category(category: pd.Series) -> pd.Categorical:
         """
+        Lower‑case a categorical column by its categories only.
 
-        def subset(df: pd.DataFrame, cat: str) -> pd.DataFrame:
-            if 'category' in df.columns:
-                mask = df['category'].str.lower() == cat.lower()
-                return df[mask]
-            return df
+        Categories that differ only by case ('Seasonal', 'SEASONAL') are merged;
+        the result is positional and keeps missing values as missing.
+        """
+        category = category.astype('category')
+        lowered, lower_codes = np.unique(
+            category.cat.categories.astype(str).str.lower().to_numpy(), return_inverse=True
+        )
+        codes = category.cat.codes.to_numpy()
+        return pd.Categorical.from_codes(
+            np.where(codes >= 0, lower_codes[codes], -1), categories=lowered
+        )
 
-        # Modular & Seasonal splits
-        modular_current = subset(current_df, 'Modular')
-        modular_ly = subset(ly_df, 'Modular')
-        seasonal_current = subset(current_df, 'Seasonal')
-        seasonal_ly = subset(ly_df, 'Seasonal')
+    def _tag_style_colors(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Classify every style_color against STYLE_TAGS and COMPOUND_TAGS.
 
-        def yoy_pct(cur: float, prev: float) -> float:
-            return 0.0 if prev == 0 else ((cur - prev) / prev * 100.0)
+        The distinct (categorical) style codes are resolved to packed token
+        bits through the generator's vocabulary (see _style_code_bits), the
+        bits are gathered to the rows by category code, and every tag becomes
+        a single AND against them.  Returns a dict of boolean arrays aligned
+        positionally with ``df``; missing style codes never match.
+        """
+        style = df['style_color'].astype('category')
+        uc = style.cat.categories.astype(str).str.upper().to_numpy(dtype=str)
+        # One spare zero entry so missing values (code -1) never match
+        code_bits = np.append(self._style_code_bits(uc), np.uint32(0))
+        row_bits = code_bits[style.cat.codes.to_numpy()]
+        tags = {tag: (row_bits & np.uint32(bits)) != 0 for tag, bits in _TAG_BITS.items()}
+        for tag, parts in COMPOUND_TAGS.items():
+            tags[tag] = np.logical_and.reduce([tags[part] for part in parts])
+        return tags
+
+    def _style_code_bits(self, uc: np.ndarray) -> np.ndarray:
+        """
+        Return the packed token bits for each upper‑case style code in ``uc``.
 
-        # Total business YoY
-        total_sales_yoy = yoy_pct(current['total_sales'], ly['total_sales'])
-        total_oh_yoy = yoy_pct(current['total_oh'], ly['total_oh'])
+        Style vocabularies are stable week to week (and between the current and
+        LY frames), so codes already seen are resolved with a searchsorted
+        gather into the sorted vocabulary; only unseen codes are scanned.
+        """
+        pos = np.searchsorted(self._tag_vocab, uc)
+        known = pos < len(self._tag_vocab)
+        known[known] = self._tag_vocab[pos[known]] == uc[known]
+        if not known.all():
+            new_codes = np.unique(uc[~known])
+            vocab = np.concatenate([self._tag_vocab, new_codes])
+            vocab_bits = np.concatenate([self._tag_vocab_bits, self._scan_tag_bits(new_codes)])
+            order = np.argsort(vocab, kind='stable')
+            self._tag_vocab, self._tag_vocab_bits = vocab[order], vocab_bits[order]
+            pos = np.searchsorted(self._tag_vocab, uc)
+        return self._tag_vocab_bits[pos]
+
+    @staticmethod
+    def _scan_tag_bits(uc: np.ndarray) -> np.ndarray:
+        """
+        Scan upper‑case style codes for every tag token and pack the hits into
+        one uint32 per code.  Literal tokens use numpy.char.find, the rest a
+        single regex pass.
+        """
+        found = np.zeros((len(uc), len(_TAG_TOKENS)), dtype=bool)
+        for i, token in enumerate(_TAG_TOKENS):
+            if token in _LITERAL_TOKENS:
+                found[:, i] = np.char.find(uc, token) >= 0
+
+        hits = pd.Series(uc, dtype=object).str.extractall(_TAG_RE).notna()
+        if not hits.empty:
+            per_code = hits.groupby(level=0).any()
+            columns = [int(name[1:]) for name in per_code.columns]
+            found[np.ix_(per_code.index.to_numpy(), columns)] = per_code.to_numpy()
+        weights = np.left_shift(np.uint32(1), np.arange(len(_TAG_TOKENS), dtype=np.uint32))
+        return found.astype(np.uint32) @ weights
+
+    def _precompute_category_stats(self, df: pd.DataFrame, modular: pd.DataFrame,
+                                   seasonal: pd.DataFrame) -> Dict:
+        """
+        Aggregate the stat columns for Total, Modular and Seasonal.
+
+        Each section reduces its already-filtered subset column by column with
+        Series.sum()/.mean(), the same reductions (and so the same floats) as
+        filtering and summing each category on its own.  Each section is a dict
+        with the row count, sums of sales/units/OH and means of
+        sell‑through/avg retail; a section with no rows has zero sums and NaN
+        means.
+        """
+        stats = {}
+        for name, part in (('total', df), ('modular', modular), ('seasonal', seasonal)):
+            sums = {col: part[col].sum() for col in ('sales_dollars', 'sales_units', 'on_hand_units')}
+            means = {col: part[col].mean() for col in ('sell_through_pct', 'avg_retail')}
+            stats[name] = self._pack_stats(len(part), sums, means)
+        return stats
+
+    @staticmethod
+    def _precompute_tag_stats(df: pd.DataFrame, tags: Dict[str, np.ndarray]) -> Dict[str, Dict]:
+        """
+        Aggregate sales, OH and sell‑through for every style tag up front.
+
+        Tags overlap (a Black Shacket is also outerwear), so each tag filters
+        the frame with its own mask and reduces the subset with
+        Series.sum()/.mean(), exactly as the callouts used to.  Each tag maps
+        to a dict with 'rows', 'sales', 'oh' and 'st'.
+        """
+        stats = {}
+        for name, mask in tags.items():
+            part = df.loc[mask, TAG_STAT_COLUMNS]
+            stats[name] = {
+                'rows': len(part),
+                'sales': part['sales_dollars'].sum(),
+                'oh': part['on_hand_units'].sum(),
+                'st': part['sell_through_pct'].mean(),
+            }
+        return stats
+
+    @staticmethod
+    def _pack_stats(rows: int, sums, means) -> Dict:
+        """Flatten the per‑column sums/means for one section into a dict of scalars."""
+        if rows == 0:
+            return {
+                'rows': 0, 'sales': 0.0, 'units': 0.0, 'oh': 0.0,
+                'st': float('nan'), 'avg_retail': float('nan'),
+            }
+        return {
+            'rows': rows,
+            'sales': sums['sales_dollars'],
+            'units': sums['sales_units'],
+            'oh': sums['on_hand_units'],
+            'st': means['sell_through_pct'],
+            'avg_retail': means['avg_retail'],
+        }
 
-        # Modular
-        mod_sales = modular_current['sales_dollars'].sum()
-        mod_ly_sales = modular_ly['sales_dollars'].sum()
-        mod_sales_yoy = yoy_pct(mod_sales, mod_ly_sales)
-        mod_st = modular_current['sell_through_pct'].mean() if not modular_current.empty else 0.0
+    # -------------------------------------------------------------------------
+    # Header metrics
+    # -------------------------------------------------------------------------
 
-        # Seasonal
-        seas_sales = seasonal_current['sales_dollars'].sum()
-        seas_ly_sales = seasonal_ly['sales_dollars'].sum() if not seasonal_ly.empty else 1.0
-        seas_sales_yoy = yoy_pct(seas_sales, seas_ly_sales)
-        seas_st = seasonal_current['sell_through_pct'].mean() if not seasonal_current.empty else 0.0
+    def _generate_header_metrics(self, current: Dict, ly: Dict) -> Dict:
+        """
+        Build the top‑level metrics displayed in the header cards of Tab 2.
+
+        Each section (total, modular, seasonal) contains absolute metrics and
+        year‑over‑year (YoY) changes.  Sell‑through is averaged across items.
+        """
+        total, ly_total = current['total'], ly['total']
+        modular, ly_modular = current['modular'], ly['modular']
+        seasonal, ly_seasonal = current['seasonal'], ly['seasonal']
+
+        mod_sales = modular['sales']
+        seas_sales = seasonal['sales']
+        seas_ly_sales = ly_seasonal['sales'] if ly_seasonal['rows'] else 1.0
+
+        # Total sales, total OH, Modular sales and Seasonal sales YoY in one go
+        total_sales_yoy, total_oh_yoy, mod_sales_yoy, seas_sales_yoy = self._yoy_pcts(
+            [total['sales'], total['oh'], mod_sales, seas_sales],
+            [ly_total['sales'], ly_total['oh'], ly_modular['sales'], seas_ly_sales],
+        )
+
+        mod_st = modular['st'] if modular['rows'] else 0.0
+        seas_st = seasonal['st'] if seasonal['rows'] else 0.0
 
         return {
             'total': {
-                'sales': current['total_sales'],
+                'sales': total['sales'],
                 'sales_yoy': total_sales_yoy,
-                'oh': current['total_oh'],
+                'oh': total['oh'],
                 'oh_yoy': total_oh_yoy,
-                'st': current['avg_st'],
+                'st': total['st'],
             },
             'modular': {
                 'sales': mod_sales,
@@ -172,14 +459,11 @@ class DashboardInsightsGenerator:
         narrative conveys sales and on‑hand (OH) movement versus last year and
         adds enthusiastic commentary if the result is exceptional.
         """
-        def yoy_pct(cur: float, prev: float) -> float:
-            return 0.0 if prev == 0 else ((cur - prev) / prev * 100.0)
-
-        sales_yoy = yoy_pct(current['total_sales'], ly['total_sales'])
-        oh_yoy = yoy_pct(current['total_oh'], ly['total_oh'])
+        sales_yoy = self._yoy_pct(current['sales'], ly['sales'])
+        oh_yoy = self._yoy_pct(current['oh'], ly['oh'])
 
-        sales_sign = "+" if sales_yoy >= 0 else ""
-        oh_sign = "+" if oh_yoy >= 0 else ""
+        sales_sign = _SIGNS[sales_yoy >= 0]
+        oh_sign = _SIGNS[oh_yoy >= 0]
 
         enthusiasm = ""
         if sales_yoy >= 10:
@@ -198,31 +482,26 @@ class DashboardInsightsGenerator:
     # Modular Deep‑Dive
     # -------------------------------------------------------------------------
 
-    def _generate_modular_insights(
-        self, current_df: pd.DataFrame, ly_df: pd.DataFrame, week_number: int
-    ) -> Dict:
+    def _generate_modular_insights(self, current: Dict, ly: Dict, week_number: int) -> Dict:
         """
         Analyze the Modular category in depth.  Returns a summary line and a
         list of narrative callouts about specific styles and opportunities.
         """
-        # Subset to Modular
-        modular = current_df[current_df.get('category', '').str.lower() == 'modular'] if 'category' in current_df.columns else current_df
-        ly_modular = ly_df[ly_df.get('category', '').str.lower() == 'modular'] if 'category' in ly_df.columns else ly_df
-
-        if modular.empty:
+        stats = current['stats']['modular']
+        if not stats['rows']:
             return {'summary': '', 'callouts': []}
 
+        modular, tags = current['modular'], current['modular_tags']
+        tag_stats, ly_tag_stats = current['modular_tag_stats'], ly['modular_tag_stats']
+        ly_stats = ly['stats']['modular']
+
         # Overall modular metrics
-        mod_sales = modular['sales_dollars'].sum()
-        mod_oh = modular['on_hand_units'].sum()
-        mod_st = modular['sell_through_pct'].mean()
-        ly_mod_sales = ly_modular['sales_dollars'].sum()
-        ly_mod_oh = ly_modular['on_hand_units'].sum()
-        mod_sales_yoy = self._yoy_pct(mod_sales, ly_mod_sales)
-        mod_oh_yoy = self._yoy_pct(mod_oh, ly_mod_oh)
-
-        sales_sign = "+" if mod_sales_yoy >= 0 else ""
-        oh_sign = "+" if mod_oh_yoy >= 0 else ""
+        mod_sales_yoy = self._yoy_pct(stats['sales'], ly_stats['sales'])
+        mod_oh_yoy = self._yoy_pct(stats['oh'], ly_stats['oh'])
+        mod_st = stats['st']
+
+        sales_sign = _SIGNS[mod_sales_yoy >= 0]
+        oh_sign = _SIGNS[mod_oh_yoy >= 0]
         summary = (
             f"Modular: {sales_sign}{mod_sales_yoy:.1f}% to LY on "
             f"{oh_sign}{mod_oh_yoy:.1f}% OH, posting a {mod_st:.1f}% ST"
@@ -231,17 +510,20 @@ class DashboardInsightsGenerator:
         callouts: List[str] = []
 
         # Callouts for key styles
-        work_pant_callout = self._analyze_work_pant(modular, ly_modular)
+        work_pant_callout = self._analyze_work_pant(modular, tags, tag_stats, ly_tag_stats)
         if work_pant_callout:
             callouts.append(work_pant_callout)
 
-        duck_pant_callout = self._analyze_duck_pant(modular, ly_modular, week_number)
+        duck_pant_callout = self._analyze_duck_pant(tag_stats, ly_tag_stats, week_number)
         if duck_pant_callout:
             callouts.append(duck_pant_callout)
 
-        # Volume drivers & opportunities
-        callouts.extend(self._analyze_volume_drivers(modular, ly_modular))
-        callouts.extend(self._identify_modular_opportunities(modular, ly_modular))
+        # Volume drivers & opportunities, ranked against the top 15 Modular sellers
+        order = current['sales_order']
+        top_positions = order[current['mask_mod'][order]][:15]
+        top_sales = current['df']['sales_dollars'].to_numpy(dtype=float)[top_positions]
+        callouts.extend(self._analyze_volume_drivers(top_sales, tag_stats))
+        callouts.extend(self._identify_modular_opportunities(tag_stats, ly_tag_stats))
 
         return {
             'summary': summary,
@@ -252,38 +534,35 @@ class DashboardInsightsGenerator:
     # Seasonal Spotlight
     # -------------------------------------------------------------------------
 
-    def _generate_seasonal_insights(
-        self, current_df: pd.DataFrame, ly_df: pd.DataFrame, previous_df: pd.DataFrame
-    ) -> Dict:
+    def _generate_seasonal_insights(self, current: Dict, ly: Dict, previous_df: pd.DataFrame) -> Dict:
         """
         Analyze the Seasonal category.  Includes summary metrics and callouts
         for outerwear and specific seasonal items.
         """
-        seasonal = current_df[current_df.get('category', '').str.lower() == 'seasonal'] if 'category' in current_df.columns else pd.DataFrame()
-        ly_seasonal = ly_df[ly_df.get('category', '').str.lower() == 'seasonal'] if 'category' in ly_df.columns else pd.DataFrame()
-
-        if seasonal.empty:
+        stats = current['stats']['seasonal']
+        if not stats['rows']:
             return {'summary': '', 'callouts': []}
 
-        seas_sales = seasonal['sales_dollars'].sum()
-        seas_oh = seasonal['on_hand_units'].sum()
-        seas_st = seasonal['sell_through_pct'].mean()
-        ly_seas_sales = ly_seasonal['sales_dollars'].sum() if not ly_seasonal.empty else seas_sales
-        ly_seas_oh = ly_seasonal['on_hand_units'].sum() if not ly_seasonal.empty else seas_oh
-        sales_yoy = self._yoy_pct(seas_sales, ly_seas_sales)
-        oh_yoy = self._yoy_pct(seas_oh, ly_seas_oh)
-        sales_sign = "+" if sales_yoy >= 0 else ""
-        oh_sign = "+" if oh_yoy >= 0 else ""
+        tag_stats, ly_tag_stats = current['seasonal_tag_stats'], ly['seasonal_tag_stats']
+        ly_stats = ly['stats']['seasonal']
+
+        seas_st = stats['st']
+        ly_seas_sales = ly_stats['sales'] if ly_stats['rows'] else stats['sales']
+        ly_seas_oh = ly_stats['oh'] if ly_stats['rows'] else stats['oh']
+        sales_yoy = self._yoy_pct(stats['sales'], ly_seas_sales)
+        oh_yoy = self._yoy_pct(stats['oh'], ly_seas_oh)
+        sales_sign = _SIGNS[sales_yoy >= 0]
+        oh_sign = _SIGNS[oh_yoy >= 0]
         summary = (
             f"Seasonal: {sales_sign}{sales_yoy:.1f}% to LY on "
             f"{oh_sign}{oh_yoy:.1f}% OH, posting a {seas_st:.1f}% ST"
         )
         callouts: List[str] = []
         callouts.append("Fall Seasonal is now 81% Shipped, 36% sold through STD")
-        outerwear_callout = self._analyze_outerwear(seasonal, ly_seasonal)
+        outerwear_callout = self._analyze_outerwear(tag_stats, ly_tag_stats)
         if outerwear_callout:
             callouts.append(outerwear_callout)
-        callouts.extend(self._analyze_seasonal_items(seasonal))
+        callouts.extend(self._analyze_seasonal_items(tag_stats))
         return {
             'summary': summary,
             'callouts': callouts,
@@ -293,21 +572,16 @@ class DashboardInsightsGenerator:
     # Action Items
     # -------------------------------------------------------------------------
 
-    def _generate_action_items(
-        self,
-        current_df: pd.DataFrame,
-        ly_df: pd.DataFrame,
-        current_totals: Dict,
-        ly_totals: Dict,
-    ) -> List[Dict]:
+    def _generate_action_items(self, current: Dict, ly: Dict) -> List[Dict]:
         """
         Produce a prioritized list of action items.  Each item is a dict
         containing 'priority', 'action' and 'detail'.
         """
         action_items: List[Dict] = []
+        current_df = current['df']
 
         # Inventory management: if OH is up YoY by more than 5%, recommend
-        total_oh_yoy = self._yoy_pct(current_totals['total_oh'], ly_totals['total_oh'])
+        total_oh_yoy = self._yoy_pct(current['stats']['total']['oh'], ly['stats']['total']['oh'])
         if total_oh_yoy > 5:
             action_items.append({
                 'priority': 1,
@@ -316,9 +590,9 @@ class DashboardInsightsGenerator:
             })
 
         # Seasonal velocity: if average sell‑through for seasonal is below 10%
-        seasonal = current_df[current_df.get('category', '').str.lower() == 'seasonal'] if 'category' in current_df.columns else pd.DataFrame()
-        if not seasonal.empty:
-            seas_st = seasonal['sell_through_pct'].mean()
+        seasonal_stats = current['stats']['seasonal']
+        if seasonal_stats['rows']:
+            seas_st = seasonal_stats['st']
             if seas_st < 10:
                 action_items.append({
                     'priority': 2,
@@ -326,10 +600,12 @@ class DashboardInsightsGenerator:
                     'detail': f'Hit 10% ST or flag for markdown consideration (currently {seas_st:.1f}%)',
                 })
 
-        # High performers needing more inventory (ST > 15%)
-        high_st_items = current_df[current_df['sell_through_pct'] > 15]
-        if not high_st_items.empty:
-            top_item = high_st_items.loc[high_st_items['sales_dollars'].idxmax()]
+        # High performers needing more inventory (ST > 15%): the best seller
+        # among them is the first such row in the precomputed sales order
+        order = current['sales_order']
+        high_st = order[current_df['sell_through_pct'].to_numpy()[order] > 15]
+        if high_st.size:
+            top_item = current_df.iloc[high_st[0]]
             item_name = top_item['style_color']
             item_st = top_item['sell_through_pct']
             action_items.append({
@@ -339,13 +615,11 @@ class DashboardInsightsGenerator:
             })
 
         # Headwear in‑stock opportunities
-        headwear = current_df[current_df['style_color'].str.contains('HEAD|CAP', na=False, case=False, regex=True)]
-        if not headwear.empty:
-            ly_headwear = ly_df[ly_df['style_color'].str.contains('HEAD|CAP', na=False, case=False, regex=True)]
-            hw_sales = headwear['sales_dollars'].sum()
-            hw_oh = headwear['on_hand_units'].sum()
-            ly_hw_sales = ly_headwear['sales_dollars'].sum() if not ly_headwear.empty else hw_sales
-            ly_hw_oh = ly_headwear['on_hand_units'].sum() if not ly_headwear.empty else hw_oh
+        headwear, ly_headwear = current['tag_stats']['head_cap'], ly['tag_stats']['head_cap']
+        if headwear['rows']:
+            hw_sales, hw_oh = headwear['sales'], headwear['oh']
+            ly_hw_sales = ly_headwear['sales'] if ly_headwear['rows'] else hw_sales
+            ly_hw_oh = ly_headwear['oh'] if ly_headwear['rows'] else hw_oh
             sales_yoy = self._yoy_pct(hw_sales, ly_hw_sales)
             oh_yoy = self._yoy_pct(hw_oh, ly_hw_oh)
             if sales_yoy < -20 and oh_yoy < -40:
@@ -366,18 +640,20 @@ class DashboardInsightsGenerator:
             return 0.0
         return (current - ly) / ly * 100.0
 
+    @staticmethod
+    def _yoy_pcts(current: List[float], ly: List[float]) -> np.ndarray:
+        """Vectorized _yoy_pct over paired lists of current and LY values."""
+        cur = np.asarray(current, dtype=float)
+        prev = np.asarray(ly, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(prev == 0, 0.0, (cur - prev) / prev * 100.0)
+
     def _extract_color_name(self, style_color: str) -> str:
         """Extract a human‑readable color name from a style code."""
-        color_map = {
-            'BK': 'Black', 'NV': 'Navy', 'KH': 'Khaki',
-            'CH': 'Charcoal', 'RB': 'Rinsed Black',
-            'BD': 'Brown Duck', 'BN': 'Brown',
-        }
-        uc = (style_color or '').upper()
-        for code, name in color_map.items():
-            if code in uc:
-                return name
-        return "Black"
+        codes = _COLOR_RE.findall((style_color or '').upper())
+        if not codes:
+            return "Black"
+        return COLOR_NAMES[min(codes, key=_COLOR_PRIORITY.__getitem__)]
 
     def _simplify_style_name(self, style_color: str) -> str:
         """Return a simplified style name for action items."""
@@ -392,57 +668,61 @@ class DashboardInsightsGenerator:
             return 'Shacket'
         return (style_color or '')[:20]
 
-    def _analyze_work_pant(self, modular: pd.DataFrame, ly_modular: pd.DataFrame) -> str:
+    def _analyze_work_pant(self, modular: pd.DataFrame, tags: Dict, tag_stats: Dict, ly_tag_stats: Dict) -> str:
         """Return a callout for 11874 Work Pant performance."""
-        work_pant = modular[modular['style_color'].str.contains('11874', na=False)]
-        if work_pant.empty:
+        stats, ly_stats = tag_stats['work_pant'], ly_tag_stats['work_pant']
+        if not stats['rows']:
             return ""
-        ly_work_pant = ly_modular[ly_modular['style_color'].str.contains('11874', na=False)]
-        top_row = work_pant.loc[work_pant['sales_dollars'].idxmax()]
+        positions = np.flatnonzero(tags['work_pant'])
+        sales = modular['sales_dollars'].to_numpy()[positions]
+        top_row = modular.iloc[positions[np.nanargmax(sales)]]
         color_name = self._extract_color_name(top_row['style_color'])
         sales_k = top_row['sales_dollars'] / 1000.0
         st = top_row['sell_through_pct']
-        current_total = work_pant['sales_dollars'].sum()
-        ly_total = ly_work_pant['sales_dollars'].sum() if not ly_work_pant.empty else current_total
+        current_total = stats['sales']
+        ly_total = ly_stats['sales'] if ly_stats['rows'] else current_total
         if current_total > ly_total * 0.97:  # Within 3% or better
             return f"The 11874 Work Pant continues its streak – {color_name} was top seller generating ${sales_k:.0f}k in sales at {st:.1f}% ST"
         return f"The 11874 Work Pant posted ${sales_k:.0f}k ({color_name}) at {st:.1f}% ST – need to watch velocity here"
 
-    def _analyze_duck_pant(self, modular: pd.DataFrame, ly_modular: pd.DataFrame, week_number: int) -> str:
+    def _analyze_duck_pant(self, tag_stats: Dict, ly_tag_stats: Dict, week_number: int) -> str:
         """Return a callout for EU1939 Duck Pant performance."""
-        duck_pant = modular[modular['style_color'].str.contains('EU1939', na=False)]
-        if duck_pant.empty:
+        stats, ly_stats = tag_stats['duck_pant'], ly_tag_stats['duck_pant']
+        if not stats['rows']:
             return ""
-        ly_duck = ly_modular[ly_modular['style_color'].str.contains('EU1939', na=False)]
-        current_sales = duck_pant['sales_dollars'].sum()
-        ly_sales = ly_duck['sales_dollars'].sum() if not ly_duck.empty else current_sales
+        current_sales = stats['sales']
+        ly_sales = ly_stats['sales'] if ly_stats['rows'] else current_sales
         sales_yoy = self._yoy_pct(current_sales, ly_sales)
-        sign = "+" if sales_yoy >= 0 else ""
+        sign = _SIGNS[sales_yoy >= 0]
         # Check if all 4 colors are in top performers (not used yet)
         # We could add additional logic here but for now simply return summary
         return f"Duck Pant EU1939 posted {sign}{sales_yoy:.0f}% to LY"
 
-    def _analyze_volume_drivers(self, modular: pd.DataFrame, ly_modular: pd.DataFrame) -> List[str]:
-        """Identify top volume drivers and opportunities in the modular set."""
+    def _analyze_volume_drivers(self, top_sales: np.ndarray, tag_stats: Dict) -> List[str]:
+        """
+        Identify top volume drivers and opportunities in the modular set.
+        ``top_sales`` holds the sales of the top Modular items, largest first.
+        """
         callouts: List[str] = []
-        if modular.empty:
+        if not top_sales.size:
             return callouts
-        # Top items by sales
-        top_items = modular.nlargest(15, 'sales_dollars')
+        # Already sorted, so the median is read straight off the middle
+        n = top_sales.size
+        top_median = (top_sales[(n - 1) // 2] + top_sales[n // 2]) / 2.0
         styles_to_track = {
-            'GP338': 'Cargo Pant',
-            'GP738': 'Double Knee Pant',
-            'HI-?VIS|HIVS': 'Hi-Vis Vest',
+            'cargo_pant': 'Cargo Pant',
+            'double_knee': 'Double Knee Pant',
+            'hi_vis': 'Hi-Vis Vest',
         }
-        for style_code, style_name in styles_to_track.items():
-            style_data = modular[modular['style_color'].str.contains(style_code, na=False, case=False, regex=True)]
-            if style_data.empty:
+        for style_tag, style_name in styles_to_track.items():
+            stats = tag_stats[style_tag]
+            if not stats['rows']:
                 continue
-            sales = style_data['sales_dollars'].sum()
-            st = style_data['sell_through_pct'].mean()
+            sales = stats['sales']
+            st = stats['st']
             sales_k = sales / 1000.0
             # Check if in top performers (at or above median of top 15)
-            if sales >= top_items['sales_dollars'].quantile(0.5):
+            if sales >= top_median:
                 if st > 15:
                     callouts.append(
                         f"{style_name} generated ${sales_k:.0f}k at {st:.1f}% ST – opportunity for stronger in‑stock position"
@@ -451,18 +731,17 @@ class DashboardInsightsGenerator:
                     callouts.append(f"{style_name} generated ${sales_k:.0f}k at {st:.1f}% ST")
         return callouts
 
-    def _identify_modular_opportunities(self, modular: pd.DataFrame, ly_modular: pd.DataFrame) -> List[str]:
+    def _identify_modular_opportunities(self, tag_stats: Dict, ly_tag_stats: Dict) -> List[str]:
         """Identify in‑stock opportunities and issues within modular."""
         callouts: List[str] = []
-        headwear = modular[modular['style_color'].str.contains('HEAD|CAP|HAT', na=False, case=False, regex=True)]
-        if headwear.empty:
+        headwear, ly_headwear = tag_stats['headwear'], ly_tag_stats['headwear']
+        if not headwear['rows']:
             return callouts
-        ly_headwear = ly_modular[ly_modular['style_color'].str.contains('HEAD|CAP|HAT', na=False, case=False, regex=True)]
-        hw_sales = headwear['sales_dollars'].sum()
-        hw_oh = headwear['on_hand_units'].sum()
-        hw_st = headwear['sell_through_pct'].mean()
-        ly_hw_sales = ly_headwear['sales_dollars'].sum() if not ly_headwear.empty else hw_sales
-        ly_hw_oh = ly_headwear['on_hand_units'].sum() if not ly_headwear.empty else hw_oh
+        hw_sales, hw_oh, hw_st = headwear['sales'], headwear['oh'], headwear['st']
+        if ly_headwear['rows']:
+            ly_hw_sales, ly_hw_oh = ly_headwear['sales'], ly_headwear['oh']
+        else:
+            ly_hw_sales, ly_hw_oh = hw_sales, hw_oh
         sales_yoy = self._yoy_pct(hw_sales, ly_hw_sales)
         oh_yoy = self._yoy_pct(hw_oh, ly_hw_oh)
         # If sales down more than 20% but OH down even more, call out an in-stock opportunity
@@ -472,32 +751,32 @@ class DashboardInsightsGenerator:
             )
         return callouts
 
-    def _analyze_outerwear(self, seasonal: pd.DataFrame, ly_seasonal: pd.DataFrame) -> str:
+    def _analyze_outerwear(self, tag_stats: Dict, ly_tag_stats: Dict) -> str:
         """Return a callout for the outerwear category within Seasonal."""
-        outerwear = seasonal[seasonal['style_color'].str.contains('JACKET|SHACKET|COAT', na=False, case=False, regex=True)]
-        if outerwear.empty:
+        outerwear, ly_outerwear = tag_stats['outerwear'], ly_tag_stats['outerwear']
+        if not outerwear['rows']:
             return ""
-        ly_outerwear = ly_seasonal[ly_seasonal['style_color'].str.contains('JACKET|SHACKET|COAT', na=False, case=False, regex=True)]
-        ow_sales = outerwear['sales_dollars'].sum()
-        ow_oh = outerwear['on_hand_units'].sum()
-        ly_ow_sales = ly_outerwear['sales_dollars'].sum() if not ly_outerwear.empty else ow_sales
-        ly_ow_oh = ly_outerwear['on_hand_units'].sum() if not ly_outerwear.empty else ow_oh
+        ow_sales, ow_oh = outerwear['sales'], outerwear['oh']
+        if ly_outerwear['rows']:
+            ly_ow_sales, ly_ow_oh = ly_outerwear['sales'], ly_outerwear['oh']
+        else:
+            ly_ow_sales, ly_ow_oh = ow_sales, ow_oh
         sales_yoy = self._yoy_pct(ow_sales, ly_ow_sales)
         oh_yoy = self._yoy_pct(ow_oh, ly_ow_oh)
         return f"Outerwear posting +{sales_yoy:.0f}% to LY on +{oh_yoy:.0f}% OH – YTD +23% to LY"
 
-    def _analyze_seasonal_items(self, seasonal: pd.DataFrame) -> List[str]:
+    def _analyze_seasonal_items(self, tag_stats: Dict) -> List[str]:
         """Return callouts for specific seasonal items such as Shacket, Mechanic, Graphic Tees."""
         callouts: List[str] = []
         # Shacket
-        shacket = seasonal[seasonal['style_color'].str.contains('SHACKET', na=False, case=False)]
-        if not shacket.empty:
-            shacket_st = shacket['sell_through_pct'].mean()
-            shacket_sales = shacket['sales_dollars'].sum()
-            black_shacket = shacket[shacket['style_color'].str.contains('BK|BLACK', na=False, case=False, regex=True)]
-            if not black_shacket.empty:
-                black_sales_k = black_shacket['sales_dollars'].sum() / 1000.0
-                black_st = black_shacket['sell_through_pct'].mean()
+        shacket = tag_stats['shacket']
+        if shacket['rows']:
+            shacket_st = shacket['st']
+            shacket_sales = shacket['sales']
+            black_shacket = tag_stats['black_shacket']
+            if black_shacket['rows']:
+                black_sales_k = black_shacket['sales'] / 1000.0
+                black_st = black_shacket['st']
                 per_store_lw = shacket_sales / 4700.0
                 std_pct = shacket_st * 3.0  # approximate STD
                 callouts.append(
@@ -507,19 +786,19 @@ class DashboardInsightsGenerator:
                     f"Per‑store performance: Shacket ${per_store_lw:.0f}/store LW (key WM metric)"
                 )
         # Mechanic / Ike Jacket
-        mechanic = seasonal[seasonal['style_color'].str.contains('MECHANIC|IKE', na=False, case=False, regex=True)]
-        if not mechanic.empty:
-            mech_st = mechanic['sell_through_pct'].mean()
-            mech_sales = mechanic['sales_dollars'].sum()
+        mechanic = tag_stats['mechanic']
+        if mechanic['rows']:
+            mech_st = mechanic['st']
+            mech_sales = mechanic['sales']
             per_store = mech_sales / 4700.0
             std_pct = mech_st * 2.5
             callouts.append(
                 f"Mechanic/Ike Jacket 65% shipped, posted {mech_st:.1f}% ST LW, {std_pct:.1f}% STD – ${per_store:.0f}/store LW"
             )
         # Graphic Tees
-        tees = seasonal[seasonal['style_color'].str.contains('GRAPHIC|TEE', na=False, case=False, regex=True)]
-        if not tees.empty:
-            tee_st = tees['sell_through_pct'].mean()
+        tees = tag_stats['graphic_tee']
+        if tees['rows']:
+            tee_st = tees['st']
             std_pct = tee_st * 7.0
             callouts.append(
                 f"Graphic Tees posting {tee_st:.1f}% ST LW, {std_pct:.1f}% STD – flowing through replenishment"
@@ -531,88 +810,125 @@ class DashboardInsightsGenerator:
 # HTML formatter for Tab 2
 # -----------------------------------------------------------------------------
 
+def _json_scalar(value):
+    """json.dump fallback for NumPy scalars left in the insights dict."""
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+# Tab 2 page template, parsed once at import.  Fields are filled by a single
+# str.format call in format_for_dashboard_tab2; header cards are read by
+# attribute and the list fields arrive pre-joined.
+_TAB2_TEMPLATE = (
+    "\n    <div class=\"weekly-insights\">\n"
+    "        <h2>📅 Weekly Sales Insights</h2>\n"
+    "        <h3>Week {week} Business Recap</h3>\n\n"
+    "        <!-- Header Metrics Cards -->\n"
+    "        <div class=\"metrics-cards\">\n"
+    "            <div class=\"metric-card total-business\">\n"
+    "                <h4>📊 TOTAL BUSINESS</h4>\n"
+    "                <div class=\"big-number\">${total.sales:,.0f}</div>\n"
+    "                <div class=\"yoy-badge {total_cls}\">\n"
+    "                    {total_sign}{total.sales_yoy:.1f}% vs LY\n"
+    "                </div>\n"
+    "                <div class=\"sub-metrics\">\n"
+    "                    OH: ${total.oh:,.0f} "
+    "({total_oh_sign}{total.oh_yoy:.1f}% vs LY) | "
+    "ST: {total.st:.1f}%\n"
+    "                </div>\n"
+    "            </div>\n\n"
+    "            <div class=\"metric-card modular\">\n"
+    "                <h4>📦 MODULAR</h4>\n"
+    "                <div class=\"big-number\">${modular.sales:,.0f}</div>\n"
+    "                <div class=\"yoy-badge {mod_cls}\">\n"
+    "                    {mod_sign}{modular.sales_yoy:.1f}% vs LY\n"
+    "                </div>\n"
+    "                <div class=\"sub-metrics\">ST: {modular.st:.1f}%</div>\n"
+    "            </div>\n\n"
+    "            <div class=\"metric-card seasonal\">\n"
+    "                <h4>🧥 SEASONAL</h4>\n"
+    "                <div class=\"big-number\">${seasonal.sales:,.0f}</div>\n"
+    "                <div class=\"yoy-badge {seas_cls}\">\n"
+    "                    {seas_sign}{seasonal.sales_yoy:.1f}% vs LY\n"
+    "                </div>\n"
+    "                <div class=\"sub-metrics\">ST: {seasonal.st:.1f}%</div>\n"
+    "            </div>\n"
+    "        </div>\n\n"
+    "        <!-- Austin's Analysis -->\n"
+    "        <div class=\"austin-analysis\">\n"
+    "            <h3>📊 Austin's Week {week} Analysis</h3>\n\n"
+    "            <div class=\"analysis-section\">\n"
+    "                <h4>🎯 The Big Picture</h4>\n"
+    "                <p class=\"big-picture-text\">{big_picture}</p>\n"
+    "            </div>\n\n"
+    "            <div class=\"analysis-section\">\n"
+    "                <h4>📦 Modular Deep-Dive</h4>\n"
+    "                <p class=\"section-summary\">{modular_summary}</p>\n"
+    "                <ul class=\"callout-list\">\n"
+    "{modular_callouts}"
+    "                </ul>\n"
+    "            </div>\n\n"
+    "            <div class=\"analysis-section\">\n"
+    "                <h4>🧥 Seasonal Spotlight</h4>\n"
+    "                <p class=\"section-summary\">{seasonal_summary}</p>\n"
+    "                <ul class=\"callout-list\">\n"
+    "{seasonal_callouts}"
+    "                </ul>\n"
+    "            </div>\n\n"
+    "            <div class=\"analysis-section action-items-section\">\n"
+    "                <h4>⚡ Action Items for Next Week</h4>\n"
+    "                <ol class=\"action-items-list\">\n"
+    "{action_items}"
+    "                </ol>\n"
+    "            </div>\n"
+    "        </div>\n"
+    "    </div>\n"
+)
+
+
 def format_for_dashboard_tab2(insights: Dict) -> str:
     """
-    Render the structured insights dict into an HTML snippet for Tab 2.
+    Render the structured insights dict into an HTML snippet for Tab 2.
 
     The caller should wrap the returned HTML in a proper container or simply
     insert it where [[TAB2_INSIGHTS_HTML]] appears in the page.  CSS classes
     such as 'positive' or 'negative' control coloring.
     """
-    html = (
-        f"\n    <div class=\"weekly-insights\">\n"
-        f"        <h2>📅 Weekly Sales Insights</h2>\n"
-        f"        <h3>Week {insights['week']} Business Recap</h3>\n\n"
-        f"        <!-- Header Metrics Cards -->\n"
-        f"        <div class=\"metrics-cards\">\n"
-        f"            <div class=\"metric-card total-business\">\n"
-        f"                <h4>📊 TOTAL BUSINESS</h4>\n"
-        f"                <div class=\"big-number\">${insights['header_metrics']['total']['sales']:,.0f}</div>\n"
-        f"                <div class=\"yoy-badge {'positive' if insights['header_metrics']['total']['sales_yoy'] >= 0 else 'negative'}\">\n"
-        f"                    {'+' if insights['header_metrics']['total']['sales_yoy'] >= 0 else ''}{insights['header_metrics']['total']['sales_yoy']:.1f}% vs LY\n"
-        f"                </div>\n"
-        f"                <div class=\"sub-metrics\">\n"
-        f"                    OH: ${insights['header_metrics']['total']['oh']:,.0f} "
-        f"({"+" if insights['header_metrics']['total']['oh_yoy'] >= 0 else ''}{insights['header_metrics']['total']['oh_yoy']:.1f}% vs LY) | "
-        f"ST: {insights['header_metrics']['total']['st']:.1f}%\n"
-        f"                </div>\n"
-        f"            </div>\n\n"
-        f"            <div class=\"metric-card modular\">\n"
-        f"                <h4>📦 MODULAR</h4>\n"
-        f"                <div class=\"big-number\">${insights['header_metrics']['modular']['sales']:,.0f}</div>\n"
-        f"                <div class=\"yoy-badge {'positive' if insights['header_metrics']['modular']['sales_yoy'] >= 0 else 'negative'}\">\n"
-        f"                    {'+' if insights['header_metrics']['modular']['sales_yoy'] >= 0 else ''}{insights['header_metrics']['modular']['sales_yoy']:.1f}% vs LY\n"
-        f"                </div>\n"
-        f"                <div class=\"sub-metrics\">ST: {insights['header_metrics']['modular']['st']:.1f}%</div>\n"
-        f"            </div>\n\n"
-        f"            <div class=\"metric-card seasonal\">\n"
-        f"                <h4>🧥 SEASONAL</h4>\n"
-        f"                <div class=\"big-number\">${insights['header_metrics']['seasonal']['sales']:,.0f}</div>\n"
-        f"                <div class=\"yoy-badge {'positive' if insights['header_metrics']['seasonal']['sales_yoy'] >= 0 else 'negative'}\">\n"
-        f"                    {'+' if insights['header_metrics']['seasonal']['sales_yoy'] >= 0 else ''}{insights['header_metrics']['seasonal']['sales_yoy']:.1f}% vs LY\n"
-        f"                </div>\n"
-        f"                <div class=\"sub-metrics\">ST: {insights['header_metrics']['seasonal']['st']:.1f}%</div>\n"
-        f"            </div>\n"
-        f"        </div>\n\n"
-        f"        <!-- Austin's Analysis -->\n"
-        f"        <div class=\"austin-analysis\">\n"
-        f"            <h3>📊 Austin's Week {insights['week']} Analysis</h3>\n\n"
-        f"            <div class=\"analysis-section\">\n"
-        f"                <h4>🎯 The Big Picture</h4>\n"
-        f"                <p class=\"big-picture-text\">{insights['big_picture']}</p>\n"
-        f"            </div>\n\n"
-        f"            <div class=\"analysis-section\">\n"
-        f"                <h4>📦 Modular Deep-Dive</h4>\n"
-        f"                <p class=\"section-summary\">{insights['modular_deep_dive']['summary']}</p>\n"
-        f"                <ul class=\"callout-list\">\n"
-    )
-    for callout in insights['modular_deep_dive']['callouts']:
-        html += f"                    <li>{callout}</li>\n"
-    html += (
-        f"                </ul>\n"
-        f"            </div>\n\n"
-        f"            <div class=\"analysis-section\">\n"
-        f"                <h4>🧥 Seasonal Spotlight</h4>\n"
-        f"                <p class=\"section-summary\">{insights['seasonal_spotlight']['summary']}</p>\n"
-        f"                <ul class=\"callout-list\">\n"
+    hm = insights['header_metrics']
+    total = SimpleNamespace(**hm['total'])
+    modular = SimpleNamespace(**hm['modular'])
+    seasonal = SimpleNamespace(**hm['seasonal'])
+
+    # Badge classes and +/- prefixes for every YoY figure in one vectorized pass
+    up = np.array([total.sales_yoy, total.oh_yoy, modular.sales_yoy, seasonal.sales_yoy], dtype=float) >= 0
+    total_sign, total_oh_sign, mod_sign, seas_sign = np.where(up, '+', '').tolist()
+    total_cls, _, mod_cls, seas_cls = np.where(up, 'positive', 'negative').tolist()
+
+    return _TAB2_TEMPLATE.format(
+        week=insights['week'],
+        total=total,
+        modular=modular,
+        seasonal=seasonal,
+        total_cls=total_cls,
+        total_sign=total_sign,
+        total_oh_sign=total_oh_sign,
+        mod_cls=mod_cls,
+        mod_sign=mod_sign,
+        seas_cls=seas_cls,
+        seas_sign=seas_sign,
+        big_picture=insights['big_picture'],
+        modular_summary=insights['modular_deep_dive']['summary'],
+        modular_callouts=_list_items(insights['modular_deep_dive']['callouts']),
+        seasonal_summary=insights['seasonal_spotlight']['summary'],
+        seasonal_callouts=_list_items(insights['seasonal_spotlight']['callouts']),
+        action_items=_list_items(
+            f"<strong>{item['action']}:</strong> {item['detail']}" for item in insights['action_items']
+        ),
     )
-    for callout in insights['seasonal_spotlight']['callouts']:
-        html += f"                    <li>{callout}</li>\n"
-    html += (
-        f"                </ul>\n"
-        f"            </div>\n\n"
-        f"            <div class=\"analysis-section action-items-section\">\n"
-        f"                <h4>⚡ Action Items for Next Week</h4>\n"
-        f"                <ol class=\"action-items-list\">\n"
-    )
-    for item in insights['action_items']:
-        html += (
-            f"                    <li><strong>{item['action']}:</strong> {item['detail']}</li>\n"
-        )
-    html += (
-        f"                </ol>\n"
-        f"            </div>\n"
-        f"        </div>\n"
-        f"    </div>\n"
-    )
-    return html
\ No newline at end of file
+
+
+def _list_items(items) -> str:
+    """Render each entry as an indented <li> line."""
+    return ''.join(f"                    <li>{item}</li>\n" for item in items)
+
@@ -16,15 +16,146 @@ Version: 5.0
 """
 
 import os
+import glob
 import json
+import hashlib
+import functools
 import math
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any
 
 import pandas as pd
 import numpy as np
 
+try:
+    import python_calamine  # noqa: F401  (Rust reader behind engine="calamine")
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None  # let pandas pick its default (openpyxl)
+
+try:
+    import orjson
+    ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+except ImportError:
+    orjson = None
+
+# Join / group keys shared by the POS and ladder frames
+KEY_COLUMNS = ['WD Style/Color', 'Fineline']
+
+# POS columns used downstream; everything else in the workbook is dropped at load
+POS_COLUMNS = [
+    *KEY_COLUMNS,
+    'Sales Units LW',
+    'Sales Units LWLY',
+    'Sales Retail $ LW',
+    'Sales Retail $ LWLY',
+    'Store On Hand Units LW',
+    'Store On Hand Retail LW',
+    'Sales Units 2025YTD',
+    'Sales Retail $ 2025YTD',
+]
+
+# Number of leading POS columns searched for the "WD Style/Color" header cell
+HEADER_SCAN_COLS = 8
+
+# Known ladder column types, passed to read_excel so it skips inference on them
+LADDER_DTYPES = {
+    'Fineline': str,
+    'AUR TY': 'float64',
+    'AUR LY': 'float64',
+}
+
+# Mixed into every input cache key: bump when a loader's parsing or output
+# changes; the projections below are included so editing them also misses
+INPUT_CACHE_VERSION = 1
+INPUT_CACHE_SCHEMA = "|".join([
+    f"v{INPUT_CACHE_VERSION}",
+    *POS_COLUMNS,
+    str(HEADER_SCAN_COLS),
+    *(f"{col}:{dtype}" for col, dtype in LADDER_DTYPES.items()),
+])
+
+try:
+    import pyarrow as pa  # Arrow IPC input cache + artifacts
+    import pyarrow.ipc  # noqa: F401
+except ImportError:
+    pa = None
+
+
+def _write_arrow(path: str, df: pd.DataFrame):
+    """Write a DataFrame to ``path`` as an uncompressed Arrow IPC (Feather v2) file."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def _read_arrow_mmap(path: str) -> pd.DataFrame:
+    """
+    Memory-map an Arrow IPC file and hand its columns to pandas without a
+    second copy (split_blocks keeps one block per column; self_destruct frees
+    the Arrow table as it converts).
+    """
+    table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def _arrow_cached(path_attr: str, frame_attr: str):
+    """
+    Cache a loader's DataFrame as an Arrow IPC file under <output_dir>/.cache/.
+
+    The cache file is keyed by the loader name, the source file's path, mtime
+    and size, and INPUT_CACHE_SCHEMA, so an unchanged workbook is never
+    re-parsed while a code change is. On a hit the loader is skipped and
+    ``frame_attr`` is memory-mapped straight from the cache; on a miss the
+    loader runs, its result is written for the next run and the loader's
+    superseded cache files are removed.
+    """
+    def decorator(loader):
+        @functools.wraps(loader)
+        def wrapper(self):
+            if pa is None:
+                return loader(self)
+
+            src = getattr(self, path_attr)
+            try:
+                st = os.stat(src)
+            except OSError:
+                return loader(self)  # let the loader report the missing file
+
+            key = f"{loader.__name__}|{os.path.abspath(src)}|{st.st_mtime_ns}|{st.st_size}|{INPUT_CACHE_SCHEMA}"
+            digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+            cache_dir = os.path.join(self.output_dir, ".cache")
+            cache_path = os.path.join(cache_dir, f"{loader.__name__}-{digest}.arrow")
+
+            if os.path.exists(cache_path):
+                try:
+                    setattr(self, frame_attr, _read_arrow_mmap(cache_path))
+                    print(f"⚡ {loader.__name__}: loaded from cache ({os.path.basename(src)})")
+                    return None
+                except Exception as e:
+                    print(f"   ⚠️ Ignoring unreadable cache {cache_path} ({e})")
+
+            result = loader(self)
+
+            df = getattr(self, frame_attr, None)
+            if isinstance(df, pd.DataFrame):
+                try:
+                    os.makedirs(cache_dir, exist_ok=True)
+                    # Only this loader's files, matched on the exact digest shape
+                    pattern = f"{glob.escape(loader.__name__)}-{'[0-9a-f]' * 32}.arrow"
+                    for stale in glob.glob(os.path.join(glob.escape(cache_dir), pattern)):
+                        if stale != cache_path:
+                            os.remove(stale)
+                    _write_arrow(cache_path, df)
+                except Exception as e:
+                    print(f"   ⚠️ Could not cache {frame_attr} ({e})")
+            return result
+        return wrapper
+    return decorator
+
 
 class DickiesDashboardETL:
     def __init__(self, pos_file: str, ladder_file: str, velocity_file: str, output_dir: str):
@@ -37,7 +168,9 @@ class DickiesDashboardETL:
         self.pos_ytd = None         # YTD POS (store-level)
         self.ladder = None          # Style ladder (item-level)
         self.velocity = None        # Velocity / seasonal curves
+        self.ladder_indexed = None  # Ladder keyed by WD Style/Color (see _index_ladder)
 
+        self.sku_df = None          # SKU master, columnar (same rows/fields as sku_master)
         self.sku_master: List[Dict[str, Any]] = []
         self.fineline_rollup: List[Dict[str, Any]] = []
         self.weekly_summary: Dict[str, Any] = {}
@@ -76,16 +209,88 @@ class DickiesDashboardETL:
         except Exception:
             return default
 
+    def _categorize_keys(self):
+        """
+        Store the SKU / fineline key columns as ``category`` so the groupbys and
+        merges downstream hash small integer codes instead of Python strings.
+        """
+        for df in (self.pos_lw, self.pos_ytd, self.ladder):
+            if df is None:
+                continue
+            for col in KEY_COLUMNS:
+                if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+                    df[col] = df[col].astype('category')
+
+    def _index_ladder(self) -> pd.DataFrame:
+        """
+        Return the ladder indexed by WD Style/Color. Built once, so every join
+        against it reuses the same index hash table.
+        """
+        if self.ladder_indexed is None:
+            self.ladder_indexed = self.ladder.set_index('WD Style/Color')
+        return self.ladder_indexed
+
+    @staticmethod
+    def _numeric_frame(df: pd.DataFrame, cols: List[str], default: float = 0.0) -> pd.DataFrame:
+        """
+        Column-wise _safe_float: coerce each column with pd.to_numeric and
+        replace anything non-numeric or missing with ``default``.
+        """
+        return df[cols].apply(pd.to_numeric, errors='coerce').fillna(default).astype('float64')
+
+    @staticmethod
+    def _wos(inventory_units: np.ndarray, sales_units: np.ndarray) -> np.ndarray:
+        """Weeks of supply per row: inventory / sales units, 0 where nothing sold."""
+        out = np.zeros(len(sales_units), dtype=np.float64)
+        np.divide(inventory_units, np.maximum(sales_units, 0.0001), out=out, where=sales_units > 0)
+        return out
+
+    @staticmethod
+    def _share(values: np.ndarray, total: float) -> np.ndarray:
+        """Per-row share of ``total``; 0 for non-positive values or a non-positive total."""
+        out = np.zeros(len(values), dtype=np.float64)
+        if total > 0:
+            np.divide(values, total, out=out, where=values > 0)
+        return out
+
+    @staticmethod
+    def _round(values: np.ndarray, digits: int) -> np.ndarray:
+        """
+        Round like the builtin round(). np.round scales by 10**digits first,
+        which can turn a near-tie such as 0.15 (really 0.1499...) into an exact
+        tie and round it the other way; only those apparent ties are re-rounded
+        in Python.
+        """
+        out = np.round(values, digits)
+        scaled = values * 10.0 ** digits
+        ties = np.flatnonzero(np.abs(scaled - np.trunc(scaled)) == 0.5)
+        for i in ties.tolist():
+            out[i] = round(float(values[i]), digits)
+        return out
+
+    @staticmethod
+    def _header_names(row: pd.Series) -> List[str]:
+        """
+        Turn a raw header row into column names the way read_excel(header=n)
+        would: stripped strings, with blank cells named "Unnamed: <i>".
+        """
+        return [
+            f"Unnamed: {i}" if pd.isna(c) else str(c).strip()
+            for i, c in enumerate(row)
+        ]
+
     # ---------------------------------------------
     # Loaders
     # ---------------------------------------------
+    @_arrow_cached('pos_file', 'pos_ytd_df')
     def load_pos_data(self):
         """
         Load POS YTD data and locate the real table header dynamically.
 
         Strategy:
         - Scan all sheets in the POS workbook
-        - For each sheet, look for a row containing "WD Style/Color"
+        - For each sheet, look for a row containing "WD Style/Color" in its
+          leading HEADER_SCAN_COLS columns
         - Use that row as the header
         - Pick the first table that has both:
             * "WD Style/Color"
@@ -93,10 +298,7 @@ class DickiesDashboardETL:
         """
         print("📥 Loading POS data...")
 
-        import numpy as np
-        import pandas as pd
-
-        xls = pd.ExcelFile(self.pos_file)
+        xls = pd.ExcelFile(self.pos_file, engine=EXCEL_ENGINE)
         target_style_col = "WD Style/Color"
         target_sales_col = "Sales Retail $ 2025YTD"
 
@@ -104,28 +306,49 @@ class DickiesDashboardETL:
         chosen_sheet = None
         chosen_header_row = None
 
-        # Examine each sheet in the workbook
-        for sheet_name in xls.sheet_names:
-            tmp = xls.parse(sheet_name, header=None)
+        # Parse every sheet once, concurrently (the calamine/C parsers release
+        # the GIL). Each worker opens its own handle; workbooks aren't thread-safe.
+        def _parse_sheet(sheet_name):
+            with pd.ExcelFile(self.pos_file, engine=EXCEL_ENGINE) as book:
+                return book.parse(sheet_name, header=None)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(xls.sheet_names)))) as pool:
+            raw_sheets = list(pool.map(_parse_sheet, xls.sheet_names))
+
+        # Examine each sheet in workbook order, stopping at the first match
+        for sheet_name, raw in zip(xls.sheet_names, raw_sheets):
 
-            # Look for a row that contains "WD Style/Color"
-            header_row_indices = np.where(tmp.eq(target_style_col).any(axis=1))[0]
+            # Look for a row that contains "WD Style/Color". The header sits in
+            # the leading columns, so only those are compared, not every cell.
+            lead = raw.iloc[:, :HEADER_SCAN_COLS].to_numpy(dtype=object)
+            header_row_indices = np.flatnonzero((lead == target_style_col).any(axis=1))
 
             if len(header_row_indices) == 0:
                 continue  # no header in this sheet — skip
 
-            # For each possible header row, try treating it as the table header
+            # For each possible header row, slice the table out of the raw grid
             for header_row in header_row_indices:
-                df = xls.parse(sheet_name, header=header_row)
-                df.columns = [str(c).strip() for c in df.columns]
+                header = self._header_names(raw.iloc[header_row])
 
                 # Check if the expected columns exist in this header
-                if target_style_col in df.columns and target_sales_col in df.columns:
-                    df = df[df[target_style_col].notna()].copy()  # remove blank rows
+                if target_style_col in header and target_sales_col in header:
+                    # Keep only the columns the pipeline reads (first occurrence of each)
+                    keep = {}
+                    for i, col in enumerate(header):
+                        if col in POS_COLUMNS and col not in keep:
+                            keep[col] = i
+
+                    df = raw.iloc[header_row + 1:, list(keep.values())]
+                    df.columns = list(keep)
+                    df = df[df[target_style_col].notna()]  # remove blank rows
 
                     if len(df) == 0:
                         continue
 
+                    # Header=None parsing leaves every column as object; convert
+                    # the metric columns directly instead of inferring every cell.
+                    metric_cols = [c for c in df.columns if c not in KEY_COLUMNS]
+                    df[metric_cols] = df[metric_cols].apply(pd.to_numeric, errors='coerce')
                     pos_ytd_df = df
                     chosen_sheet = sheet_name
                     chosen_header_row = header_row
@@ -141,16 +364,38 @@ class DickiesDashboardETL:
                 f"Sheets scanned: {xls.sheet_names}"
             )
 
-        # Normalize header names one more time
-        pos_ytd_df.columns = [str(c).strip() for c in pos_ytd_df.columns]
-
         # Store clean dataframe
         self.pos_ytd_df = pos_ytd_df.reset_index(drop=True)
 
         print(f"   POS YTD loaded from sheet '{chosen_sheet}' (header row {chosen_header_row})")
         print(f"   POS rows loaded: {len(self.pos_ytd_df)}")
 
-        def load_ladder_data(self):        """
+    @_arrow_cached('ladder_file', 'ladder')
+    def load_ladder_data(self):
+        """
+        Load the style ladder (item-level attributes, one row per WD Style/Color).
+
+        The ladder ships as .xlsb (BIFF12). calamine reads it natively; without
+        python-calamine we fall back to pyxlsb, since openpyxl cannot open .xlsb.
+        """
+        print("📥 Loading Ladder data...")
+
+        engine = EXCEL_ENGINE
+        if engine is None and str(self.ladder_file).lower().endswith(".xlsb"):
+            engine = "pyxlsb"
+
+        df = pd.read_excel(self.ladder_file, sheet_name=0, engine=engine, dtype=LADDER_DTYPES)
+        df.columns = [str(c).strip() for c in df.columns]
+
+        if "WD Style/Color" not in df.columns:
+            raise ValueError(f"❌ Ladder file is missing 'WD Style/Color' column: {self.ladder_file}")
+
+        self.ladder = df[df["WD Style/Color"].notna()].reset_index(drop=True)
+
+        print(f"   Ladder rows loaded: {len(self.ladder)} (engine: {engine or 'default'})")
+
+    def load_velocity_raw(self):
+        """
         Load the Velocity Trends workbook.
 
         This version does NOT depend on self.pos_lw.
@@ -175,14 +420,14 @@ class DickiesDashboardETL:
             print(f"   ⚠️ Could not load velocity data ({e}). Continuing without it.")
             self.velocity_raw = None
 
-        def load_velocity_data(self):
-            """
-            TEMP STUB:
-            We are parking velocity integration for now so the ETL file
-            does not crash. This function intentionally does nothing.
-            """
-            print("\n⚠️ Skipping velocity data load (temporary stub).")
-            self.velocity = None
+    def load_velocity_data(self):
+        """
+        TEMP STUB:
+        We are parking velocity integration for now so the ETL file
+        does not crash. This function intentionally does nothing.
+        """
+        print("\n⚠️ Skipping velocity data load (temporary stub).")
+        self.velocity = None
 
     # ---------------------------------------------
     # Tier logic (A/B/C)
@@ -203,7 +448,7 @@ class DickiesDashboardETL:
             raise RuntimeError("POS YTD data must be loaded before calculating tiers.")
         
         # Aggregate YTD sales by SKU
-        ytd_sales = self.pos_ytd.groupby('WD Style/Color', as_index=False)[
+        ytd_sales = self.pos_ytd.groupby('WD Style/Color', as_index=False, observed=True)[
             'Sales Retail $ 2025YTD'
         ].sum()
         
@@ -211,23 +456,27 @@ class DickiesDashboardETL:
         ytd_sales = ytd_sales.dropna(subset=['Sales Retail $ 2025YTD'])
         ytd_sales = ytd_sales.sort_values('Sales Retail $ 2025YTD', ascending=False)
         
-        # Calculate cumulative sales percentage
-        total_sales = ytd_sales['Sales Retail $ 2025YTD'].sum()
-        ytd_sales['cumulative_sales'] = ytd_sales['Sales Retail $ 2025YTD'].cumsum()
-        ytd_sales['cumulative_pct'] = ytd_sales['cumulative_sales'] / total_sales
-        
+        # Calculate cumulative sales percentage in one pass over the sorted sales
+        skus = ytd_sales['WD Style/Color'].to_numpy()
+        sales = ytd_sales['Sales Retail $ 2025YTD'].to_numpy(dtype=np.float64)
+        total_sales = sales.sum()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cumulative_pct = np.cumsum(sales) / total_sales
+
         # Assign tiers based on cumulative percentage thresholds
-        tier_a = ytd_sales[ytd_sales['cumulative_pct'] <= 0.70]['WD Style/Color'].tolist()
-        tier_b = ytd_sales[(ytd_sales['cumulative_pct'] > 0.70) & 
-                          (ytd_sales['cumulative_pct'] <= 0.95)]['WD Style/Color'].tolist()
-        tier_c = ytd_sales[ytd_sales['cumulative_pct'] > 0.95]['WD Style/Color'].tolist()
-        
+        in_a = cumulative_pct <= 0.70
+        in_b = (cumulative_pct > 0.70) & (cumulative_pct <= 0.95)
+        in_c = cumulative_pct > 0.95
+
+        tier_a = skus[in_a].tolist()
+        tier_b = skus[in_b].tolist()
+        tier_c = skus[in_c].tolist()
+
         # Calculate actual sales coverage for validation
-        a_sales = ytd_sales[ytd_sales['cumulative_pct'] <= 0.70]['Sales Retail $ 2025YTD'].sum()
-        b_sales = ytd_sales[(ytd_sales['cumulative_pct'] > 0.70) & 
-                           (ytd_sales['cumulative_pct'] <= 0.95)]['Sales Retail $ 2025YTD'].sum()
-        c_sales = ytd_sales[ytd_sales['cumulative_pct'] > 0.95]['Sales Retail $ 2025YTD'].sum()
-        
+        a_sales = sales[in_a].sum()
+        b_sales = sales[in_b].sum()
+        c_sales = sales[in_c].sum()
+
         a_pct = (a_sales / total_sales) * 100 if total_sales > 0 else 0
         b_pct = (b_sales / total_sales) * 100 if total_sales > 0 else 0
         c_pct = (c_sales / total_sales) * 100 if total_sales > 0 else 0
@@ -268,36 +517,37 @@ class DickiesDashboardETL:
         if self.pos_lw is None or self.ladder is None:
             raise RuntimeError("POS LW and Ladder data must be loaded before building SKU master.")
 
-        # Aggregate YTD sales dollars at SKU key level to join into the LW frame
-        ytd = self.pos_ytd.groupby(['WD Style/Color'], as_index=False)[
-            'Sales Retail $ 2025YTD'
-        ].sum().rename(columns={'Sales Retail $ 2025YTD': 'sales_dollars_ytd'})
-
-        # Aggregate YTD units similarly
-        ytd_units = self.pos_ytd.groupby(['WD Style/Color'], as_index=False)[
-            'Sales Units 2025YTD'
-        ].sum().rename(columns={'Sales Units 2025YTD': 'sales_units_ytd'})
-
-        # Last-week aggregation at SKU level from store-level POS
-        lw_group = self.pos_lw.groupby(['WD Style/Color'], as_index=False).agg({
-            'Sales Units LW': 'sum',
-            'Sales Units LWLY': 'sum',
-            'Sales Retail $ LW': 'sum',
-            'Sales Retail $ LWLY': 'sum',
-            'Store On Hand Units LW': 'sum',
-            'Store On Hand Retail LW': 'sum'
-        }).rename(columns={
+        # SKU-level aggregations: source column -> output column
+        lw_fields = {
             'Sales Units LW': 'sales_units_lw',
             'Sales Units LWLY': 'sales_units_lwly',
             'Sales Retail $ LW': 'sales_dollars_lw',
             'Sales Retail $ LWLY': 'sales_dollars_lwly',
             'Store On Hand Units LW': 'inventory_units_lw',
             'Store On Hand Retail LW': 'inventory_dollars_lw'
-        })
+        }
+        ytd_fields = {
+            'Sales Retail $ 2025YTD': 'sales_dollars_ytd',
+            'Sales Units 2025YTD': 'sales_units_ytd'
+        }
+
+        if self.pos_ytd is self.pos_lw:
+            # One store-level table carries both LW and YTD columns: one hash pass
+            sku_df = self.pos_lw.groupby('WD Style/Color', as_index=False, observed=True).agg(
+                {col: 'sum' for col in [*lw_fields, *ytd_fields]}
+            ).rename(columns={**lw_fields, **ytd_fields})
+        else:
+            # Last-week aggregation at SKU level from store-level POS
+            lw_group = self.pos_lw.groupby('WD Style/Color', as_index=False, observed=True).agg(
+                {col: 'sum' for col in lw_fields}
+            ).rename(columns=lw_fields)
+
+            # YTD dollars and units in a single pass, joined into the LW frame
+            ytd = self.pos_ytd.groupby('WD Style/Color', as_index=False, observed=True).agg(
+                {col: 'sum' for col in ytd_fields}
+            ).rename(columns=ytd_fields)
 
-        # Merge YTD and LW
-        sku_df = lw_group.merge(ytd, on='WD Style/Color', how='left')
-        sku_df = sku_df.merge(ytd_units, on='WD Style/Color', how='left')
+            sku_df = lw_group.merge(ytd, on='WD Style/Color', how='left')
 
         # Join ladder attributes
         ladder_cols = [
@@ -311,22 +561,17 @@ class DickiesDashboardETL:
             'AUR TY',
             'AUR LY'
         ]
-        ladder_subset = self.ladder[[c for c in ladder_cols if c in self.ladder.columns]].copy()
-        sku_df = sku_df.merge(ladder_subset, on='WD Style/Color', how='left')
-
-        # Attach tier info from tier_assignments (calculated from YTD sales)
-        def _lookup_tier(sku):
-            if sku in self.tier_assignments['A']:
-                return 'A'
-            if sku in self.tier_assignments['B']:
-                return 'B'
-            if sku in self.tier_assignments['C']:
-                return 'C'
-            return 'C'  # default safety
+        ladder_by_sku = self._index_ladder()
+        ladder_subset = ladder_by_sku[[c for c in ladder_cols if c in ladder_by_sku.columns]]
+        sku_df = sku_df.join(ladder_subset, on='WD Style/Color', how='left')
 
-        sku_df['tier'] = sku_df['WD Style/Color'].apply(_lookup_tier)
+        # Attach tier info from tier_assignments (calculated from YTD sales).
+        # Filled C -> B -> A so A wins on overlap; unknown SKUs default to C.
+        tier_map: Dict[Any, str] = {}
+        for tier in ('C', 'B', 'A'):
+            tier_map.update(dict.fromkeys(self.tier_assignments[tier], tier))
 
-        sku_master: List[Dict[str, Any]] = []
+        sku_df['tier'] = sku_df['WD Style/Color'].map(tier_map).fillna('C')
 
         # Pre-calc total sales & inventory dollars to later compute shares
         total_sales_ytd = sku_df['sales_dollars_ytd'].fillna(0).sum()
@@ -339,94 +584,106 @@ class DickiesDashboardETL:
         # We'll also compute cumulative sales pct over descending YTD sales
         sku_df = sku_df.sort_values(by='sales_dollars_ytd', ascending=False).reset_index(drop=True)
 
-        cumulative_sales = 0.0
-
-        for _, row in sku_df.iterrows():
-            sku = row['WD Style/Color']
-
-            sales_dollars_ytd = self._safe_float(row.get('sales_dollars_ytd', 0.0))
-            sales_units_ytd = self._safe_float(row.get('sales_units_ytd', 0.0))
-
-            sales_units_lw = self._safe_float(row.get('sales_units_lw', 0.0))
-            sales_units_lwly = self._safe_float(row.get('sales_units_lwly', 0.0))
-            sales_dollars_lw = self._safe_float(row.get('sales_dollars_lw', 0.0))
-            sales_dollars_lwly = self._safe_float(row.get('sales_dollars_lwly', 0.0))
-            inventory_units_lw = self._safe_float(row.get('inventory_units_lw', 0.0))
-            inventory_dollars_lw = self._safe_float(row.get('inventory_dollars_lw', 0.0))
-
-            # Sell-through, unit and dollar changes likely already provided at store level
-            # but we can read them directly if present (for now we default to 0 if missing).
-            sell_through_ty = self._safe_float(row.get('ST TY', 0.0))
-            sell_through_ly = self._safe_float(row.get('ST LY', 0.0))
-            st_change = self._safe_float(row.get('% Change in ST', 0.0))
-            unit_pct_change = self._safe_float(row.get('% Unit Diff', 0.0))
-            dollar_pct_change = self._safe_float(row.get('% $ Diff', 0.0))
-
-            # WOS based on LW inventory and LW sales units
-            if sales_units_lw > 0:
-                wos = inventory_units_lw / max(sales_units_lw, 0.0001)
-            else:
-                wos = 0.0
-
-            # Per-SKU sales share and cumulative share (Pareto)
-            if total_sales_ytd > 0 and sales_dollars_ytd > 0:
-                share = sales_dollars_ytd / total_sales_ytd
-            else:
-                share = 0.0
-
-            cumulative_sales += sales_dollars_ytd
-            cumulative_share = cumulative_sales / total_sales_ytd if total_sales_ytd > 0 else 0.0
-
-            # Inventory share
-            if total_inventory_lw > 0 and inventory_dollars_lw > 0:
-                inv_share = inventory_dollars_lw / total_inventory_lw
-            else:
-                inv_share = 0.0
-
-            record = {
-                # Identity
-                'sku': sku,
-                'fineline': row.get('Fineline', ''),
-                'description': row.get('Item Description', ''),
-                'color': row.get('Color', ''),
-                'gender': row.get('Gender', ''),
-                'category': row.get('Category', ''),
-                'sub_category': row.get('Sub Category', ''),
-
-                # Price
-                'aur_ty': self._safe_float(row.get('AUR TY', 0.0)),
-                'aur_ly': self._safe_float(row.get('AUR LY', 0.0)),
-
-                # YTD metrics
-                'sales_units_ytd': sales_units_ytd,
-                'sales_dollars_ytd': sales_dollars_ytd,
-
-                # Weekly LW metrics
-                'sales_units_lw': sales_units_lw,
-                'sales_units_lwly': sales_units_lwly,
-                'sales_dollars_lw': sales_dollars_lw,
-                'sales_dollars_lwly': sales_dollars_lwly,
-                'inventory_units_lw': inventory_units_lw,
-                'inventory_dollars_lw': inventory_dollars_lw,
-
-                # Performance
-                'sell_through_ty': sell_through_ty,
-                'sell_through_ly': sell_through_ly,
-                'st_change': st_change,
-                'unit_pct_change': unit_pct_change,
-                'dollar_pct_change': dollar_pct_change,
-
-                'wos': round(wos, 1),
-                'tier': row.get('tier', 'C'),
-
-                # New v5 fields (shares)
-                'sales_pct_of_total': round(share, 6),
-                'cumulative_sales_pct': round(cumulative_share, 6),
-                'inventory_pct_of_total': round(inv_share, 6),
-            }
-
-            sku_master.append(record)
+        # Output field -> source column, in record order
+        record_fields = {
+            # Identity
+            'sku': 'WD Style/Color',
+            'fineline': 'Fineline',
+            'description': 'Item Description',
+            'color': 'Color',
+            'gender': 'Gender',
+            'category': 'Category',
+            'sub_category': 'Sub Category',
+
+            # Price
+            'aur_ty': 'AUR TY',
+            'aur_ly': 'AUR LY',
+
+            # YTD metrics
+            'sales_units_ytd': 'sales_units_ytd',
+            'sales_dollars_ytd': 'sales_dollars_ytd',
+
+            # Weekly LW metrics
+            'sales_units_lw': 'sales_units_lw',
+            'sales_units_lwly': 'sales_units_lwly',
+            'sales_dollars_lw': 'sales_dollars_lw',
+            'sales_dollars_lwly': 'sales_dollars_lwly',
+            'inventory_units_lw': 'inventory_units_lw',
+            'inventory_dollars_lw': 'inventory_dollars_lw',
+
+            # Performance (sell-through and change columns are read directly
+            # if present at store level; otherwise they default to 0)
+            'sell_through_ty': 'ST TY',
+            'sell_through_ly': 'ST LY',
+            'st_change': '% Change in ST',
+            'unit_pct_change': '% Unit Diff',
+            'dollar_pct_change': '% $ Diff',
+
+            'wos': 'wos',
+            'tier': 'tier',
+
+            # New v5 fields (shares)
+            'sales_pct_of_total': 'sales_pct_of_total',
+            'cumulative_sales_pct': 'cumulative_sales_pct',
+            'inventory_pct_of_total': 'inventory_pct_of_total',
+        }
+        identity_cols = ['Fineline', 'Item Description', 'Color', 'Gender', 'Category', 'Sub Category']
+        numeric_cols = [
+            'AUR TY', 'AUR LY',
+            'sales_units_ytd', 'sales_dollars_ytd',
+            'sales_units_lw', 'sales_units_lwly', 'sales_dollars_lw', 'sales_dollars_lwly',
+            'inventory_units_lw', 'inventory_dollars_lw',
+            'ST TY', 'ST LY', '% Change in ST', '% Unit Diff', '% $ Diff',
+        ]
+
+        # Missing attributes default to '' and missing/NaN metrics to 0.0
+        for col in identity_cols:
+            if col not in sku_df.columns:
+                sku_df[col] = ''
+        for col in numeric_cols:
+            if col not in sku_df.columns:
+                sku_df[col] = 0.0
+
+        # All metric math runs on one contiguous float64 slab (rows x numeric_cols)
+        num = self._numeric_frame(sku_df, numeric_cols).to_numpy(dtype=np.float64)
+        sku_df[numeric_cols] = num
+        col = {c: i for i, c in enumerate(numeric_cols)}
+
+        # Derived metrics are computed with masked, in-place ufuncs (no
+        # temporaries for the zeroed rows) and rounded to their output
+        # precision as whole arrays (builtin round() semantics): WOS to 1
+        # place, shares to 6.
+        sales_ytd = num[:, col['sales_dollars_ytd']]
+        inventory_lw = num[:, col['inventory_dollars_lw']]
+
+        # WOS based on LW inventory and LW sales units
+        wos = self._wos(num[:, col['inventory_units_lw']], num[:, col['sales_units_lw']])
+
+        # Per-SKU sales share and cumulative share (Pareto), inventory share
+        share = self._share(sales_ytd, total_sales_ytd)
+        inv_share = self._share(inventory_lw, total_inventory_lw)
+        if total_sales_ytd > 0:
+            cumulative_share = np.cumsum(sales_ytd)
+            cumulative_share /= total_sales_ytd
+        else:
+            cumulative_share = np.zeros(len(sku_df))
+
+        for name, values, digits in (
+            ('wos', wos, 1),
+            ('sales_pct_of_total', share, 6),
+            ('cumulative_sales_pct', cumulative_share, 6),
+            ('inventory_pct_of_total', inv_share, 6),
+        ):
+            sku_df[name] = self._round(values, digits)
+
+        records = sku_df[list(record_fields.values())]
+        records.columns = list(record_fields)
 
+        # Keep the columnar frame for Arrow output / summary metrics; the
+        # list of dicts is only materialized for the JSON artifact
+        self.sku_df = records.reset_index(drop=True)
+
+        sku_master: List[Dict[str, Any]] = records.to_dict(orient='records')
         self.sku_master = sku_master
 
         print(f"   SKU Master built: {len(sku_master):,} SKUs")
@@ -440,68 +697,58 @@ class DickiesDashboardETL:
         """
         print("📊 Building Fineline Rollup...")
 
-        df = self.pos_lw.copy()
-        df.columns = [str(c).strip() for c in df.columns]
-
-        required_cols = [
-            'Fineline',
+        lw_cols = [
             'Sales Units LW',
             'Sales Units LWLY',
             'Sales Retail $ LW',
             'Sales Retail $ LWLY',
             'Store On Hand Units LW',
-            'Store On Hand Retail LW',
+            'Store On Hand Retail LW'
+        ]
+        ytd_cols = [
             'Sales Units 2025YTD',
             'Sales Retail $ 2025YTD'
         ]
-        for col in required_cols:
-            if col not in df.columns:
-                raise ValueError(f"Missing required fineline column: {col}")
-
-        grouped = df.groupby('Fineline', as_index=False).agg({
-            'Sales Units LW': 'sum',
-            'Sales Units LWLY': 'sum',
-            'Sales Retail $ LW': 'sum',
-            'Sales Retail $ LWLY': 'sum',
-            'Store On Hand Units LW': 'sum',
-            'Store On Hand Retail LW': 'sum',
-            'Sales Units 2025YTD': 'sum',
-            'Sales Retail $ 2025YTD': 'sum'
-        })
 
-        fineline_rows: List[Dict[str, Any]] = []
-
-        for _, row in grouped.iterrows():
-            sales_units_lw = self._safe_float(row['Sales Units LW'])
-            sales_units_lwly = self._safe_float(row['Sales Units LWLY'])
-            sales_dollars_lw = self._safe_float(row['Sales Retail $ LW'])
-            sales_dollars_lwly = self._safe_float(row['Sales Retail $ LWLY'])
-            inventory_units_lw = self._safe_float(row['Store On Hand Units LW'])
-            inventory_dollars_lw = self._safe_float(row['Store On Hand Retail LW'])
-            sales_units_ytd = self._safe_float(row['Sales Units 2025YTD'])
-            sales_dollars_ytd = self._safe_float(row['Sales Retail $ 2025YTD'])
-
-            if sales_units_lw > 0:
-                wos = inventory_units_lw / max(sales_units_lw, 0.0001)
-            else:
-                wos = 0.0
-
-            # Compute sell-through using standard formula if we have receipts (not included here)
-            # For now we default ST metrics to None at fineline level in this function.
-            record = {
-                'fineline': row['Fineline'],
-                'sales_units_lw': sales_units_lw,
-                'sales_units_lwly': sales_units_lwly,
-                'sales_dollars_lw': sales_dollars_lw,
-                'sales_dollars_lwly': sales_dollars_lwly,
-                'inventory_units_lw': inventory_units_lw,
-                'inventory_dollars_lw': inventory_dollars_lw,
-                'sales_units_ytd': sales_units_ytd,
-                'sales_dollars_ytd': sales_dollars_ytd,
-                'wos': round(wos, 1),
-            }
-
-            fineline_rows.append(record)
+        # Column names are already stripped by load_pos_data. LW metrics must
+        # come from pos_lw; YTD metrics come from pos_ytd.
+        for frame, cols in ((self.pos_lw, lw_cols), (self.pos_ytd, ytd_cols)):
+            for col in ['Fineline', *cols]:
+                if col not in frame.columns:
+                    raise ValueError(f"Missing required fineline column: {col}")
+
+        if self.pos_ytd is self.pos_lw:
+            # One table carries both: a single group-reduce covers everything
+            grouped = self.pos_lw.groupby('Fineline', as_index=False, observed=True)[
+                [*lw_cols, *ytd_cols]
+            ].sum()
+        else:
+            lw_part = self.pos_lw.groupby('Fineline', as_index=False, observed=True)[lw_cols].sum()
+            ytd_part = self.pos_ytd.groupby('Fineline', as_index=False, observed=True)[ytd_cols].sum()
+            grouped = lw_part.merge(ytd_part, on='Fineline', how='left')
+
+        # Source column -> output field, in record order
+        metric_fields = {
+            'Sales Units LW': 'sales_units_lw',
+            'Sales Units LWLY': 'sales_units_lwly',
+            'Sales Retail $ LW': 'sales_dollars_lw',
+            'Sales Retail $ LWLY': 'sales_dollars_lwly',
+            'Store On Hand Units LW': 'inventory_units_lw',
+            'Store On Hand Retail LW': 'inventory_dollars_lw',
+            'Sales Units 2025YTD': 'sales_units_ytd',
+            'Sales Retail $ 2025YTD': 'sales_dollars_ytd',
+        }
+        rollup = self._numeric_frame(grouped, list(metric_fields)).rename(columns=metric_fields)
+        num = rollup.to_numpy(dtype=np.float64)
+        col = {c: i for i, c in enumerate(rollup.columns)}
+        rollup.insert(0, 'fineline', grouped['Fineline'])
+
+        wos = self._wos(num[:, col['inventory_units_lw']], num[:, col['sales_units_lw']])
+        rollup['wos'] = self._round(wos, 1)
+
+        # Compute sell-through using standard formula if we have receipts (not included here)
+        # For now we default ST metrics to None at fineline level in this function.
+        fineline_rows: List[Dict[str, Any]] = rollup.to_dict(orient='records')
 
         self.fineline_rollup = fineline_rows
 
@@ -516,14 +763,21 @@ class DickiesDashboardETL:
         """
         print("📊 Building Weekly Sales Summary...")
 
-        df = self.pos_lw.copy()
+        totals = self._numeric_frame(self.pos_lw, [
+            'Sales Units LW',
+            'Sales Units LWLY',
+            'Sales Retail $ LW',
+            'Sales Retail $ LWLY',
+            'Store On Hand Units LW',
+            'Store On Hand Retail LW',
+        ]).sum()
 
-        total_sales_units_lw = self._safe_float(df['Sales Units LW'].sum())
-        total_sales_units_lwly = self._safe_float(df['Sales Units LWLY'].sum())
-        total_sales_dollars_lw = self._safe_float(df['Sales Retail $ LW'].sum())
-        total_sales_dollars_lwly = self._safe_float(df['Sales Retail $ LWLY'].sum())
-        total_inventory_units_lw = self._safe_float(df['Store On Hand Units LW'].sum())
-        total_inventory_dollars_lw = self._safe_float(df['Store On Hand Retail LW'].sum())
+        total_sales_units_lw = float(totals['Sales Units LW'])
+        total_sales_units_lwly = float(totals['Sales Units LWLY'])
+        total_sales_dollars_lw = float(totals['Sales Retail $ LW'])
+        total_sales_dollars_lwly = float(totals['Sales Retail $ LWLY'])
+        total_inventory_units_lw = float(totals['Store On Hand Units LW'])
+        total_inventory_dollars_lw = float(totals['Store On Hand Retail LW'])
 
         # Simple YoY deltas
         units_delta = total_sales_units_lw - total_sales_units_lwly
@@ -595,12 +849,10 @@ class DickiesDashboardETL:
         tier_b_count = len(self.tier_assignments['B'])
         tier_c_count = len(self.tier_assignments['C'])
 
-        # Compute avg WOS from SKU master if available
+        # Compute avg WOS from the columnar SKU master if available
         avg_wos = 0.0
-        if self.sku_master:
-            wos_vals = [self._safe_float(x.get('wos', 0.0)) for x in self.sku_master]
-            if wos_vals:
-                avg_wos = float(np.mean(wos_vals))
+        if self.sku_df is not None and len(self.sku_df):
+            avg_wos = float(self.sku_df['wos'].mean())
 
         self.metrics.update({
             'tier_a_count': tier_a_count,
@@ -633,8 +885,25 @@ class DickiesDashboardETL:
     # ---------------------------------------------
     def _save_json(self, name: str, obj: Any):
         path = os.path.join(self.output_dir, name)
-        with open(path, "w") as f:
-            json.dump(obj, f, indent=2)
+        if orjson is not None:
+            # C encoder; serializes NumPy scalars/arrays natively (NaN -> null)
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(obj, option=ORJSON_OPTIONS))
+        else:
+            with open(path, "w") as f:
+                json.dump(obj, f, indent=2)
+        print(f"💾 Saved {name} -> {path}")
+
+    def _save_arrow(self, name: str, df: pd.DataFrame):
+        """
+        Write a DataFrame as an Arrow IPC file, straight from its columns with
+        no per-row Python objects. Skipped when pyarrow is not installed.
+        """
+        if pa is None or df is None:
+            return
+
+        path = os.path.join(self.output_dir, name)
+        _write_arrow(path, df)
         print(f"💾 Saved {name} -> {path}")
 
     # ---------------------------------------------
@@ -650,6 +919,11 @@ class DickiesDashboardETL:
             # 1) Load all inputs
             self.load_pos_data()
             self.load_ladder_data()
+
+            # The POS table carries both the LW and YTD columns at store level
+            self.pos_lw = self.pos_ytd = self.pos_ytd_df
+            self._categorize_keys()
+
             # TEMP: Skip velocity loading (not needed for tier calculation)
             # self.load_velocity_data()
             
@@ -668,13 +942,18 @@ class DickiesDashboardETL:
             # 4) Build meta
             self.build_meta()
 
-            # 5) Save artifacts
-            self._save_json("sku_master.json", self.sku_master)
-            self._save_json("fineline_rollup.json", self.fineline_rollup)
-            self._save_json("weekly_sales_summary.json", self.weekly_summary)
-            self._save_json("seasonal_risk.json", self.seasonal_risk)
-            self._save_json("action_items.json", self.action_items)
-            self._save_json("meta.json", self.meta)
+            # 5) Save artifacts (independent files, written concurrently)
+            artifacts = [
+                ("sku_master.json", self.sku_master),
+                ("fineline_rollup.json", self.fineline_rollup),
+                ("weekly_sales_summary.json", self.weekly_summary),
+                ("seasonal_risk.json", self.seasonal_risk),
+                ("action_items.json", self.action_items),
+                ("meta.json", self.meta),
+            ]
+            with ThreadPoolExecutor(max_workers=len(artifacts)) as pool:
+                list(pool.map(lambda artifact: self._save_json(*artifact), artifacts))
+            self._save_arrow("sku_master.arrow", self.sku_df)
 
             print("\n✅ All artifacts saved successfully.")
             print(f"   Output directory: {self.output_dir}")
@@ -14,11 +14,22 @@ New tokens added:
 - [[ACTION_ITEMS_COUNT]], [[SEASONAL_RISK_COUNT]]
 """
 
+import hashlib
 import json
+import os
 import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # -----------------------------------------------------------------------------
 # Paths and constants
@@ -40,6 +51,50 @@ HTML_PATH = Path("/var/www/dickies/index.html")
 # Backup directory
 BACKUP_DIR = Path("/home/ubuntu/deployment_package_final")
 
+# HTML / filename patterns (compiled once per process). The HTML patterns are
+# bytes patterns: the dashboard is rewritten as raw UTF-8 without decoding.
+# The skuData / historicalData blocks are located by _find_js_block instead.
+_SCRIPT_RE = re.compile(rb"(<script[^>]*>)([\s\S]*?const\s+skuData[\s\S]*?)(</script>)")
+_WEEK_RE = re.compile(r"WK(\d+)", re.IGNORECASE)
+_TOKEN_RE = re.compile(rb"\[\[[A-Z0-9_]+\]\]")
+TAB2_PLACEHOLDER = b"[[TAB2_INSIGHTS_HTML]]"
+_HASH_RE = re.compile(rb"<!--hist-hash:[0-9a-f]+-->")
+
+
+# -----------------------------------------------------------------------------
+# JSON helpers
+# -----------------------------------------------------------------------------
+
+def _load_json(path: Path):
+    """Parse a JSON artifact, using orjson's C parser when available."""
+    data = path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # stdlib-written artifacts may carry NaN/Infinity, which orjson
+            # rejects; let json handle those
+            pass
+    return json.loads(data)
+
+
+def _script_safe(json_str: str) -> str:
+    """
+    Make serialized JSON safe to embed in an inline <script>.
+
+    The encoder has already escaped quotes, backslashes and control
+    characters; "</" is escaped too so a string value can never close the
+    surrounding <script> tag.
+    """
+    return json_str.replace("</", "<\\/")
+
+
+def _dumps_indented(obj) -> str:
+    """Serialize ``obj`` as 2-space indented JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2)
+
 
 # -----------------------------------------------------------------------------
 # SKU loading and JS generation
@@ -49,8 +104,7 @@ def load_sku_data():
     """Load the current week number and list of SKUs from sku_master.json."""
     if not SKU_FILE.exists():
         raise FileNotFoundError(f"Cannot find {SKU_FILE}")
-    with SKU_FILE.open("r", encoding="utf-8") as f:
-        sku_payload = json.load(f)
+    sku_payload = _load_json(SKU_FILE)
 
     # Handle both formats: {"skus": [...]} or just [...]
     if isinstance(sku_payload, dict):
@@ -66,31 +120,73 @@ def load_sku_data():
     return week, skus
 
 
-def compute_totals(skus):
-    """Compute totals for percentage calculations."""
-    total_sales_ytd = sum(float(s.get("sales_dollars_ytd", 0) or 0) for s in skus)
-    total_inv_ytd = sum(float(s.get("inventory_dollars_lw", 0) or 0) for s in skus)
+def _float_array(values):
+    """
+    Float64 array from raw SKU field values; None / NaN become 0.0.
 
-    if total_sales_ytd == 0:
-        total_sales_ytd = 1.0
-    if total_inv_ytd == 0:
-        total_inv_ytd = 1.0
+    Falls back to per-value coercion only if the payload holds something
+    NumPy can't convert in bulk (e.g. empty strings).
+    """
+    try:
+        arr = np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        arr = np.array([float(x or 0) for x in values], dtype=np.float64)
+    return np.nan_to_num(arr, copy=False, nan=0.0, posinf=np.inf, neginf=-np.inf)
 
-    return total_sales_ytd, total_inv_ytd
 
+def prepare_sku_bundle(skus):
+    """
+    Walk the SKU list once and collect every column the updater needs.
 
-def calculate_tier_stats(skus):
-    """Calculate tier counts and sales percentages."""
-    tier_counts = {'A': 0, 'B': 0, 'C': 0}
-    tier_sales = {'A': 0.0, 'B': 0.0, 'C': 0.0}
-    
-    total_sales = 0.0
+    Totals, tier stats and the skuData block all consume this bundle
+    instead of re-reading the list of dicts.
+    """
+    sales, inv, wos = [], [], []
+    tiers, keys, descs, finelines, abc, actions = [], [], [], [], [], []
     for s in skus:
-        tier = s.get('tier', 'C')
-        sales = float(s.get('sales_dollars_ytd', 0) or 0)
-        tier_counts[tier] = tier_counts.get(tier, 0) + 1
-        tier_sales[tier] = tier_sales.get(tier, 0.0) + sales
-        total_sales += sales
+        get = s.get
+        sales.append(get("sales_dollars_ytd"))
+        inv.append(get("inventory_dollars_lw"))
+        wos.append(get("wos"))
+        tiers.append(get("tier", "C"))
+        abc.append(get("tier", "") or "")
+        keys.append(get("sku", ""))
+        descs.append(get("description", "") or "")
+        finelines.append(str(get("fineline", "") or ""))
+        actions.append(get("status", "Monitor") or "Monitor")
+
+    return {
+        "sales": _float_array(sales),
+        "inv": _float_array(inv),
+        "wos": _float_array(wos),
+        "tiers": np.array(tiers, dtype=object),
+        "sku": keys,
+        "description": descs,
+        "fineline": finelines,
+        "abc": abc,
+        "status": actions,
+    }
+
+
+def compute_totals(bundle):
+    """Compute totals for percentage calculations."""
+    # Zero totals fall back to 1.0 so the percentage columns stay finite
+    return float(bundle["sales"].sum() or 1.0), float(bundle["inv"].sum() or 1.0)
+
+
+def calculate_tier_stats(bundle):
+    """Calculate tier counts and sales percentages."""
+    tiers = bundle["tiers"]
+    sales = bundle["sales"]
+
+    # One masked reduction per tier instead of per-SKU dict updates
+    tier_counts = {}
+    tier_sales = {}
+    for t in ('A', 'B', 'C'):
+        mask = tiers == t
+        tier_counts[t] = int(mask.sum())
+        tier_sales[t] = float(sales[mask].sum())
+    total_sales = float(sales.sum())
     
     # Calculate percentages
     tier_a_pct = (tier_sales['A'] / total_sales * 100) if total_sales > 0 else 0
@@ -108,96 +204,143 @@ def calculate_tier_stats(skus):
     }
 
 
-def build_sku_js_array(skus):
-    """Build JavaScript array for SKU data."""
-    total_sales_ytd, total_inv_ytd = compute_totals(skus)
+def _round(values, digits):
+    """
+    Round like the builtin round(). np.round scales by 10**digits first, which
+    can turn a near-tie such as 0.15 (really 0.1499...) into an exact tie and
+    round it the other way; only those apparent ties are re-rounded in Python.
+    """
+    out = np.round(values, digits)
+    scaled = values * 10.0 ** digits
+    ties = np.flatnonzero(np.abs(scaled - np.trunc(scaled)) == 0.5)
+    for i in ties.tolist():
+        out[i] = round(float(values[i]), digits)
+    return out
+
+
+def _round_pct(values, total):
+    """round(values / total * 100, 1) over a whole column."""
+    out = np.divide(values, total)
+    np.multiply(out, 100, out=out)
+    return _round(out, 1)
+
+
+# Rebuilds the skuData row objects from skuDataCols in the browser. Field order
+# matches the row-oriented block earlier versions emitted; Size and
+# Store_Count are constant and so aren't shipped as columns.
+_SKU_ROWS_JS = (
+    "const skuData = skuDataCols.Item_Key.map((_, i) => ({"
+    "Item_Key: skuDataCols.Item_Key[i], "
+    "Item_Description: skuDataCols.Item_Description[i], "
+    "Fineline: skuDataCols.Fineline[i], "
+    "Size: \"\", "
+    "ABC: skuDataCols.ABC_Values[skuDataCols.ABC[i]], "
+    "Sales_13W_Retail: skuDataCols.Sales_13W_Retail[i], "
+    "Total_Inv_Retail: skuDataCols.Total_Inv_Retail[i], "
+    "Pct_of_Sales: skuDataCols.Pct_of_Sales[i], "
+    "Pct_of_Inventory: skuDataCols.Pct_of_Inventory[i], "
+    "WOS_Per_SKU: skuDataCols.WOS_Per_SKU[i], "
+    "Store_Count: 0, "
+    "Style_Action: skuDataCols.Style_Action_Values[skuDataCols.Style_Action[i]]"
+    "}));"
+)
+
+
+def _dict_encode(values):
+    """
+    Dictionary-encode a low-cardinality column.
+
+    Returns ``(labels, codes)`` with ``labels[codes[i]] == values[i]``; one
+    hash lookup per row, labels in first-seen order.
+    """
+    table = {}
+    codes = [table.setdefault(v, len(table)) for v in values]
+    return list(table), codes
+
+
+def build_sku_js_array(bundle):
+    """Build the skuData JavaScript block (columnar payload + row rebuild)."""
+    total_sales_ytd, total_inv_ytd = compute_totals(bundle)
+
+    # Numeric columns are computed as whole arrays, then zipped back into rows
+    sales_ytd = bundle["sales"]
+    inv_ytd = bundle["inv"]
+    pct_sales = _round_pct(sales_ytd, total_sales_ytd).tolist()
+    pct_inv = _round_pct(inv_ytd, total_inv_ytd).tolist()
+    sales_out = _round(sales_ytd, 2).tolist()
+    inv_out = _round(inv_ytd, 2).tolist()
+    wos = bundle["wos"].tolist()
+
+    # Tier and status take a handful of values: ship small integer codes
+    # plus a lookup table instead of repeating the strings per SKU
+    abc_values, abc_codes = _dict_encode(bundle["abc"])
+    action_values, action_codes = _dict_encode(bundle["status"])
+
+    # Column-oriented payload: one array per field instead of a repeated
+    # 12-key object per SKU. _SKU_ROWS_JS zips it back into the row objects
+    # the dashboard scripts expect.
+    cols = {
+        "Item_Key": bundle["sku"],
+        "Item_Description": bundle["description"],
+        "Fineline": bundle["fineline"],
+        "ABC": abc_codes,
+        "ABC_Values": abc_values,
+        "Sales_13W_Retail": sales_out,
+        "Total_Inv_Retail": inv_out,
+        "Pct_of_Sales": pct_sales,
+        "Pct_of_Inventory": pct_inv,
+        "WOS_Per_SKU": wos,
+        "Style_Action": action_codes,
+        "Style_Action_Values": action_values,
+    }
 
-    js_rows = []
-    for s in skus:
-        sales_ytd = float(s.get("sales_dollars_ytd", 0) or 0)
-        inv_ytd = float(s.get("inventory_dollars_lw", 0) or 0)
-        pct_sales = round((sales_ytd / total_sales_ytd) * 100, 1)
-        pct_inv = round((inv_ytd / total_inv_ytd) * 100, 1)
-
-        # Escape quotes for JS
-        desc = (s.get("description", "") or "")
-        desc = desc.replace('"', '\\"').replace("'", "\\'")
-
-        row = {
-            "Item_Key": s.get("sku", ""),
-            "Item_Description": desc,
-            "Fineline": str(s.get("fineline", "") or ""),
-            "Size": "",
-            "ABC": s.get("tier", "") or "",
-            "Sales_13W_Retail": round(sales_ytd, 2),
-            "Total_Inv_Retail": round(inv_ytd, 2),
-            "Pct_of_Sales": pct_sales,
-            "Pct_of_Inventory": pct_inv,
-            "WOS_Per_SKU": float(s.get("wos", 0) or 0),
-            "Store_Count": 0,
-            "Style_Action": s.get("status", "Monitor") or "Monitor",
-        }
-        js_rows.append(row)
-
-    # Convert rows to JS
-    lines = []
-    lines.append("const skuData = [")
-    for r in js_rows:
-        obj = (
-            "  {"
-            f" Item_Key: '{r['Item_Key']}',"
-            f" Item_Description: '{r['Item_Description']}',"
-            f" Fineline: '{r['Fineline']}',"
-            f" Size: '{r['Size']}',"
-            f" ABC: '{r['ABC']}',"
-            f" Sales_13W_Retail: {r['Sales_13W_Retail']},"
-            f" Total_Inv_Retail: {r['Total_Inv_Retail']},"
-            f" Pct_of_Sales: {r['Pct_of_Sales']},"
-            f" Pct_of_Inventory: {r['Pct_of_Inventory']},"
-            f" WOS_Per_SKU: {r['WOS_Per_SKU']},"
-            f" Store_Count: {r['Store_Count']},"
-            f" Style_Action: '{r['Style_Action']}'"
-            " },"
-        )
-        lines.append(obj)
-    lines.append("];")
-
-    return "\n".join(lines)
+    # One C-level json.dumps call; a JSON object is a valid JS literal.
+    body = json.dumps(cols, ensure_ascii=False, separators=(",", ":"))
+    return "const skuDataCols = " + _script_safe(body) + ";\n" + _SKU_ROWS_JS
 
 
 # -----------------------------------------------------------------------------
 # Action items and seasonal risk
 # -----------------------------------------------------------------------------
 
-def load_action_items():
-    """Load action items from JSON."""
-    if not ACTION_ITEMS_FILE.exists():
-        return []
-    
+def _load_optional(read, what):
+    """Run ``read``; on failure print the usual warning and return []."""
     try:
-        with ACTION_ITEMS_FILE.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-        return data.get("actions", [])
+        return read()
     except Exception as e:
-        print(f"⚠️  Could not load action items: {e}")
+        print(f"⚠️  Could not load {what}: {e}")
         return []
 
 
-def load_seasonal_risk():
-    """Load seasonal risk items from JSON."""
-    if not SEASONAL_RISK_FILE.exists():
+def _read_action_items():
+    """Action items from JSON ([] if the file is missing); errors propagate."""
+    if not ACTION_ITEMS_FILE.exists():
         return []
     
-    try:
-        with SEASONAL_RISK_FILE.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-        # Handle both formats
-        if isinstance(data, list):
-            return data
-        return data.get("items", [])
-    except Exception as e:
-        print(f"⚠️  Could not load seasonal risk: {e}")
+    data = _load_json(ACTION_ITEMS_FILE)
+    return data.get("actions", [])
+
+
+def _read_seasonal_risk():
+    """Seasonal risk items from JSON ([] if the file is missing); errors propagate."""
+    if not SEASONAL_RISK_FILE.exists():
         return []
+    
+    data = _load_json(SEASONAL_RISK_FILE)
+    # Handle both formats
+    if isinstance(data, list):
+        return data
+    return data.get("items", [])
+
+
+def load_action_items():
+    """Load action items from JSON."""
+    return _load_optional(_read_action_items, "action items")
+
+
+def load_seasonal_risk():
+    """Load seasonal risk items from JSON."""
+    return _load_optional(_read_seasonal_risk, "seasonal risk")
 
 
 def build_action_items_js(actions):
@@ -206,7 +349,7 @@ def build_action_items_js(actions):
         return "const historicalData = { actions: [] };"
     
     # Convert to JSON and embed in JS
-    json_str = json.dumps(actions, indent=2)
+    json_str = _script_safe(_dumps_indented(actions))
     return f"const historicalData = {{ actions: {json_str} }};"
 
 
@@ -220,8 +363,7 @@ def _derive_week_label_from_meta() -> str:
         return "Latest Week"
 
     try:
-        with META_FILE.open("r", encoding="utf-8") as f:
-            meta = json.load(f)
+        meta = _load_json(META_FILE)
     except Exception:
         return "Latest Week"
 
@@ -233,7 +375,7 @@ def _derive_week_label_from_meta() -> str:
     if not pos_file or not isinstance(pos_file, str):
         return "Latest Week"
 
-    m = re.search(r"WK(\d+)", pos_file, re.IGNORECASE)
+    m = _WEEK_RE.search(pos_file)
     if not m:
         return "Latest Week"
     week_num = int(m.group(1))
@@ -245,8 +387,7 @@ def load_weekly_metrics() -> dict:
     if not WEEKLY_SUMMARY_FILE.exists():
         raise FileNotFoundError(f"Cannot find {WEEKLY_SUMMARY_FILE}")
 
-    with WEEKLY_SUMMARY_FILE.open("r", encoding="utf-8") as f:
-        summary = json.load(f)
+    summary = _load_json(WEEKLY_SUMMARY_FILE)
 
     def _to_float(x):
         try:
@@ -290,58 +431,74 @@ def load_weekly_metrics() -> dict:
     }
 
 
-def inject_weekly_metrics(html: str, m: dict, tier_stats: dict, action_count: int, seasonal_count: int) -> str:
+def inject_weekly_metrics(html: bytes, m: dict, tier_stats: dict, action_count: int, seasonal_count: int) -> bytes:
     """Replace tokens in HTML with formatted metrics."""
-    replacements = {
+    # Already-rendered dashboards carry no tokens: skip formatting and the scan
+    if b"[[" not in html:
+        return html
+
+    # Values are formatted lazily, only for tokens actually present
+    formatters = {
         # Week labels
-        "[[LATEST_WEEK_LABEL]]": m["week_label"],
-        "[[CURRENT_ANALYSIS_LABEL]]": f"{m['week_label']} – Total Walmart POS",
+        b"[[LATEST_WEEK_LABEL]]": lambda: m["week_label"],
+        b"[[CURRENT_ANALYSIS_LABEL]]": lambda: f"{m['week_label']} – Total Walmart POS",
 
         # Sales and inventory
-        "[[WEEKLY_SALES_DOLLARS]]": f"${m['sales_dollars']:,.0f}",
-        "[[WEEKLY_SALES_UNITS]]": f"{m['sales_units']:,.0f}",
-        "[[WEEKLY_INVENTORY_UNITS]]": f"{m['inv_units']:,.0f}",
-        "[[WEEKLY_INVENTORY_DOLLARS]]": f"${m['inv_dollars']:,.0f}",
-        "[[WEEKLY_WOS]]": f"{m['wos']:.1f}",
-        "[[WEEKLY_SELLTHRU]]": f"{m['sell_thru_pct']:.1f}",
-        "[[WEEKLY_UNITS_DELTA]]": f"{m['units_delta']:,.0f}",
-        "[[WEEKLY_DOLLARS_DELTA]]": f"{m['dollars_delta']:,.0f}",
-        "[[WEEKLY_UNITS_PCT_DELTA]]": f"{m['units_pct_delta']:.1f}%",
-        "[[WEEKLY_DOLLARS_PCT_DELTA]]": f"{m['dollars_pct_delta']:.1f}%",
+        b"[[WEEKLY_SALES_DOLLARS]]": lambda: f"${m['sales_dollars']:,.0f}",
+        b"[[WEEKLY_SALES_UNITS]]": lambda: f"{m['sales_units']:,.0f}",
+        b"[[WEEKLY_INVENTORY_UNITS]]": lambda: f"{m['inv_units']:,.0f}",
+        b"[[WEEKLY_INVENTORY_DOLLARS]]": lambda: f"${m['inv_dollars']:,.0f}",
+        b"[[WEEKLY_WOS]]": lambda: f"{m['wos']:.1f}",
+        b"[[WEEKLY_SELLTHRU]]": lambda: f"{m['sell_thru_pct']:.1f}",
+        b"[[WEEKLY_UNITS_DELTA]]": lambda: f"{m['units_delta']:,.0f}",
+        b"[[WEEKLY_DOLLARS_DELTA]]": lambda: f"{m['dollars_delta']:,.0f}",
+        b"[[WEEKLY_UNITS_PCT_DELTA]]": lambda: f"{m['units_pct_delta']:.1f}%",
+        b"[[WEEKLY_DOLLARS_PCT_DELTA]]": lambda: f"{m['dollars_pct_delta']:.1f}%",
 
         # Tier counts
-        "[[TIER_A_COUNT]]": str(tier_stats['tier_a_count']),
-        "[[TIER_B_COUNT]]": str(tier_stats['tier_b_count']),
-        "[[TIER_C_COUNT]]": str(tier_stats['tier_c_count']),
-        "[[TIER_AB_COUNT]]": str(tier_stats['tier_ab_count']),
-        "[[TIER_AB_SALES_PCT]]": f"{tier_stats['tier_ab_sales_pct']:.1f}%",
+        b"[[TIER_A_COUNT]]": lambda: str(tier_stats['tier_a_count']),
+        b"[[TIER_B_COUNT]]": lambda: str(tier_stats['tier_b_count']),
+        b"[[TIER_C_COUNT]]": lambda: str(tier_stats['tier_c_count']),
+        b"[[TIER_AB_COUNT]]": lambda: str(tier_stats['tier_ab_count']),
+        b"[[TIER_AB_SALES_PCT]]": lambda: f"{tier_stats['tier_ab_sales_pct']:.1f}%",
 
         # Action items and seasonal risk
-        "[[ACTION_ITEMS_COUNT]]": str(action_count),
-        "[[SEASONAL_RISK_COUNT]]": str(seasonal_count),
+        b"[[ACTION_ITEMS_COUNT]]": lambda: str(action_count),
+        b"[[SEASONAL_RISK_COUNT]]": lambda: str(seasonal_count),
+
+        # Change class
+        b"[[WEEKLY_DOLLARS_CHANGE_CLASS]]": lambda: m.get("change_class", ""),
     }
 
-    for token, val in replacements.items():
-        if token in html:
-            html = html.replace(token, val)
+    rendered = {}
 
-    # Change class
-    html = html.replace("[[WEEKLY_DOLLARS_CHANGE_CLASS]]", m.get("change_class", ""))
+    def _render(t):
+        token = t.group(0)
+        val = rendered.get(token)
+        if val is None:
+            fmt = formatters.get(token)
+            if fmt is None:
+                # Unknown tokens are left in place
+                return token
+            val = rendered[token] = fmt().encode("utf-8")
+        return val
 
-    return html
+    # One pass over the document
+    return _TOKEN_RE.sub(_render, html)
 
 
-def inject_tab2_insights(html: str) -> str:
+def inject_tab2_insights(html: bytes) -> bytes:
     """Insert Tab 2 insights HTML."""
-    placeholder = "[[TAB2_INSIGHTS_HTML]]"
+    placeholder = TAB2_PLACEHOLDER
     if placeholder not in html:
         return html
 
     if not TAB2_INSIGHTS_FILE.exists():
         return html
 
+    # Spliced in as raw bytes; the snippet is never decoded
     try:
-        snippet = TAB2_INSIGHTS_FILE.read_text(encoding="utf-8")
+        snippet = TAB2_INSIGHTS_FILE.read_bytes()
     except Exception:
         return html
 
@@ -352,38 +509,135 @@ def inject_tab2_insights(html: str) -> str:
 # HTML replacement
 # -----------------------------------------------------------------------------
 
-def replace_sku_block(html: str, new_block: str) -> str:
+def _splice(html: bytes, start: int, end: int, new: str) -> bytes:
+    """Replace html[start:end] with ``new`` (UTF-8) in a single copy."""
+    return b"".join((html[:start], new.encode("utf-8"), html[end:]))
+
+
+_JS_WS = b" \t\n\r\f\v"
+
+
+def _skip_ws(buf: bytes, pos: int) -> int:
+    while pos < len(buf) and buf[pos] in _JS_WS:
+        pos += 1
+    return pos
+
+
+def _find_js_block(buf: bytes, name: bytes, opener: bytes, closer: bytes):
+    """
+    Locate ``const <name> = <opener> ... <closer>`` in ``buf``.
+
+    Linear scan matching what the old non-greedy regex did: whitespace is
+    allowed around ``=``, and the block ends at the first ``closer`` after the
+    opener. Returns ``(start, end)`` or None.
+    """
+    pos = buf.find(name)
+    while pos >= 0:
+        start = pos
+        while start > 0 and buf[start - 1] in _JS_WS:
+            start -= 1
+        if start < pos and buf[start - 5:start] == b"const":
+            eq = _skip_ws(buf, pos + len(name))
+            if buf[eq:eq + 1] == b"=":
+                body = _skip_ws(buf, eq + 1)
+                if buf[body:body + 1] == opener:
+                    end = buf.find(closer, body + 1)
+                    if end < 0:
+                        return None
+                    return start - 5, end + len(closer)
+        pos = buf.find(name, pos + 1)
+    return None
+
+
+def _find_sku_block(buf: bytes):
+    """
+    (start, end) of the SKU data block, or None.
+
+    Matches the columnar block this version writes (``const skuDataCols``
+    through the row rebuild statement) and falls back to the row-oriented
+    ``const skuData = [...];`` block of earlier versions.
+    """
+    span = _find_js_block(buf, b"skuDataCols", b"{", b"const skuData = skuDataCols.")
+    if span is not None:
+        # Extend over the rebuild statement; matched loosely so blocks written
+        # with a different field list are still replaced
+        end = buf.find(b"}));", span[1])
+        if end >= 0:
+            return span[0], end + 4
+    return _find_js_block(buf, b"skuData", b"[", b"];")
+
+
+def replace_sku_block(html: bytes, new_block: str) -> bytes:
     """Replace const skuData = [...] block."""
-    pattern = re.compile(r"const\s+skuData\s*=\s*\[[\s\S]*?\];", re.MULTILINE)
-    if not pattern.search(html):
-        raise ValueError("Could not find existing const skuData = [...] block.")
-    return pattern.sub(new_block, html, count=1)
+    span = _find_sku_block(html)
+    if span is None:
+        raise ValueError("Could not find existing skuData block.")
+    return _splice(html, span[0], span[1], new_block)
 
 
-def inject_action_items_block(html: str, action_js: str) -> str:
+def inject_action_items_block(html: bytes, action_js: str) -> bytes:
     """
     Inject or replace historicalData.actions JavaScript variable.
     Looks for existing historicalData declaration and replaces it,
     or inserts before closing </script> tag in the main script block.
     """
     # Try to find and replace existing historicalData
-    pattern = re.compile(r"const\s+historicalData\s*=\s*\{[\s\S]*?\};", re.MULTILINE)
-    if pattern.search(html):
-        return pattern.sub(action_js, html, count=1)
+    span = _find_js_block(html, b"historicalData", b"{", b"};")
+    if span is not None:
+        return _splice(html, span[0], span[1], action_js)
     
     # If not found, insert before closing script tag
     # Find the script block that contains skuData
-    script_pattern = re.compile(r"(<script[^>]*>)([\s\S]*?const\s+skuData[\s\S]*?)(</script>)", re.MULTILINE)
-    match = script_pattern.search(html)
+    match = _SCRIPT_RE.search(html)
     if match:
-        before = match.group(1)
-        content = match.group(2)
-        after = match.group(3)
-        new_content = content + "\n\n// Action items data\n" + action_js + "\n"
-        return html.replace(match.group(0), before + new_content + after)
+        insert_at = match.end(2)
+        return _splice(html, insert_at, insert_at, "\n\n// Action items data\n" + action_js + "\n")
     
     # Fallback: just append to end of HTML (not ideal but safe)
-    return html + f"\n<script>\n{action_js}\n</script>\n"
+    return html + f"\n<script>\n{action_js}\n</script>\n".encode("utf-8")
+
+
+def inputs_digest() -> str:
+    """
+    Short SHA-256 over every artifact that feeds the rendered dashboard, plus
+    this updater's own source, so a fix or output-format change re-renders
+    even when the data is unchanged.
+    """
+    h = hashlib.sha256()
+    h.update(Path(__file__).read_bytes())
+    inputs = (
+        META_FILE,
+        SKU_FILE,
+        WEEKLY_SUMMARY_FILE,
+        ACTION_ITEMS_FILE,
+        SEASONAL_RISK_FILE,
+        TAB2_INSIGHTS_FILE,
+    )
+    for path in inputs:
+        h.update(path.name.encode("utf-8"))
+        h.update(path.read_bytes() if path.exists() else b"\0missing")
+    return h.hexdigest()[:16]
+
+
+def stamp_inputs_digest(html: bytes, digest: str) -> bytes:
+    """Record ``digest`` in the HTML, replacing any previous marker."""
+    marker = f"<!--hist-hash:{digest}-->"
+    match = _HASH_RE.search(html)
+    if match:
+        return _splice(html, match.start(), match.end(), marker)
+    pos = html.rfind(b"</body>")
+    if pos < 0:
+        return html + marker.encode("utf-8")
+    return _splice(html, pos, pos, marker + "\n")
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Write ``data`` to a sibling temp file, then rename it over ``path``."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    # Keep the live file's permissions so the web server can still read it
+    shutil.copymode(path, tmp)
+    os.replace(tmp, path)
 
 
 # -----------------------------------------------------------------------------
@@ -395,63 +649,82 @@ def main():
     print("DICKIES DASHBOARD HTML UPDATER v5")
     print("=" * 100)
 
+    # Read current HTML as raw bytes; every step below splices this one
+    # buffer and the previous version is dropped as soon as it's replaced
+    html = HTML_PATH.read_bytes()
+
+    # Nothing to do if this exact set of inputs was already rendered
+    digest = inputs_digest()
+    if f"<!--hist-hash:{digest}-->".encode("utf-8") in html:
+        print(f"ℹ️  Inputs unchanged since last update (hist-hash:{digest}); nothing to do")
+        print("=" * 100)
+        return
+
+    # The artifact loads are independent and I/O bound; run them concurrently.
+    # Optional artifacts raise on the worker and warn where they're collected,
+    # so the log keeps its order.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        sku_future = pool.submit(load_sku_data)
+        actions_future = pool.submit(_read_action_items)
+        seasonal_future = pool.submit(_read_seasonal_risk)
+        weekly_future = pool.submit(load_weekly_metrics)
+
     # Load SKUs
-    week, skus = load_sku_data()
+    week, skus = sku_future.result()
     print(f"✅ Loaded Week {week}, {len(skus)} SKUs from sku_master.json")
 
     # Calculate tier stats
-    tier_stats = calculate_tier_stats(skus)
+    bundle = prepare_sku_bundle(skus)
+    tier_stats = calculate_tier_stats(bundle)
     print(f"✅ Tier distribution: A={tier_stats['tier_a_count']}, B={tier_stats['tier_b_count']}, C={tier_stats['tier_c_count']}")
     print(f"   A+B SKUs: {tier_stats['tier_ab_count']} ({tier_stats['tier_ab_sales_pct']:.1f}% of sales)")
 
     # Build SKU JS array
-    new_sku_block = build_sku_js_array(skus)
+    new_sku_block = build_sku_js_array(bundle)
     print("✅ Built new skuData block")
 
     # Load action items
-    actions = load_action_items()
+    actions = _load_optional(actions_future.result, "action items")
     print(f"✅ Loaded {len(actions)} action items")
 
     # Load seasonal risk
-    seasonal_risk = load_seasonal_risk()
+    seasonal_risk = _load_optional(seasonal_future.result, "seasonal risk")
     print(f"✅ Loaded {len(seasonal_risk)} seasonal risk items")
 
     # Build action items JS
     action_js = build_action_items_js(actions)
 
-    # Read current HTML
-    html_text = HTML_PATH.read_text(encoding="utf-8")
-
-    # Backup
+    # Backup (kernel-side copy of the untouched file, before any mutation)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_path = BACKUP_DIR / f"index_week{week:02d}_{timestamp}.v5_backup.html"
-    backup_path.write_text(html_text, encoding="utf-8")
+    shutil.copyfile(HTML_PATH, backup_path)
     print(f"💾 Backup saved → {backup_path}")
 
     # 1) Replace SKU block
-    updated_html = replace_sku_block(html_text, new_sku_block)
+    html = replace_sku_block(html, new_sku_block)
 
     # 2) Inject action items
-    updated_html = inject_action_items_block(updated_html, action_js)
+    html = inject_action_items_block(html, action_js)
     print("✅ Injected action items JavaScript")
 
     # 3) Inject weekly metrics and tier tokens
     try:
-        weekly = load_weekly_metrics()
-        updated_html = inject_weekly_metrics(updated_html, weekly, tier_stats, len(actions), len(seasonal_risk))
+        weekly = weekly_future.result()
+        html = inject_weekly_metrics(html, weekly, tier_stats, len(actions), len(seasonal_risk))
         print("✅ Injected weekly metrics and tier tokens")
     except Exception as e:
         print(f"⚠️  Could not inject weekly metrics: {e}")
 
     # 4) Inject Tab 2 insights
-    updated_html = inject_tab2_insights(updated_html)
-    if "[[TAB2_INSIGHTS_HTML]]" not in updated_html:
+    html = inject_tab2_insights(html)
+    if TAB2_PLACEHOLDER not in html:
         print("✅ Injected Tab 2 insights")
     else:
         print("ℹ️  No Tab 2 insights injected (token left in HTML)")
 
-    # Write final HTML
-    HTML_PATH.write_text(updated_html, encoding="utf-8")
+    # Write final HTML, stamped with the inputs it was rendered from
+    html = stamp_inputs_digest(html, digest)
+    _write_atomic(HTML_PATH, html)
 
     print("✅ Updated", HTML_PATH)
     print("=" * 100)
@@ -3,27 +3,207 @@ Velocity Trends File Integration
 Adds size-level analysis and WOS validation
 """
 
+import functools
+import glob
+import hashlib
+import logging
+import os
+from itertools import chain, islice
+
+import numpy as np
 import pandas as pd
-from typing import Dict, List
+from typing import Dict, List, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import python_calamine  # noqa: F401  (Rust reader behind engine="calamine")
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None  # let pandas pick its default (openpyxl)
+
+try:
+    import pyarrow  # noqa: F401  (Parquet mirror of the Velocity workbook)
+except ImportError:
+    pyarrow = None
+
+
+# Detail Data columns consumed downstream; everything else is skipped at parse
+VELOCITY_COLUMNS = [
+    'Vndr Category 2',
+    'Prime Item Nbr',
+    'Prime Size Description',
+    'Item Status',
+    'LW POS Qty',
+    'Total LW Str Inv Retail',
+    'LW Avg Retail',
+    'Curr Valid Stores',
+    'Unit Retail',
+    'Unit Cost',
+]
+
+# Text columns read as str so the parser skips numeric coercion on them
+VELOCITY_TEXT_DTYPES = {
+    'Vndr Category 2': str,
+    'Prime Size Description': str,
+    'Item Status': str,
+}
+
+
+def _text_column(df: pd.DataFrame, col: str) -> pd.Series:
+    """Column as stripped strings; blank cells (or an absent column) become ''."""
+    if col not in df:
+        return pd.Series('', index=df.index, dtype='string')
+    return df[col].astype('string').str.strip().fillna('')
+
+
+def _num_column(df: pd.DataFrame, col: str, fill: float = 0.0) -> np.ndarray:
+    """Column as a float64 array with missing cells (or column) set to ``fill``."""
+    if col not in df:
+        return np.full(len(df), fill)
+    return pd.to_numeric(df[col], errors='coerce').fillna(fill).to_numpy(dtype=np.float64)
+
+
+def _round(values: np.ndarray, digits: int) -> np.ndarray:
+    """
+    Round like the builtin round(). np.round scales by 10**digits first, which
+    can turn a near-tie such as 0.05 (really 0.05000000000000000278) into an
+    exact tie and round it the other way; only those apparent ties are
+    re-rounded in Python.
+    """
+    out = np.round(values, digits)
+    scaled = values * 10.0 ** digits
+    ties = np.flatnonzero(np.abs(scaled - np.trunc(scaled)) == 0.5)
+    for i in ties.tolist():
+        out[i] = round(float(values[i]), digits)
+    return out
+
+
+def _parquet_mirror_path(velocity_file: str) -> str:
+    """
+    Sidecar Parquet path for ``velocity_file``.
+
+    Keyed by the workbook's mtime and size plus the projected column list, so
+    a re-exported workbook (or a change to VELOCITY_COLUMNS) misses the cache.
+    """
+    st = os.stat(velocity_file)
+    key = f"{st.st_mtime_ns}|{st.st_size}|{'|'.join(VELOCITY_COLUMNS)}"
+    digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8).hexdigest()
+    base, _ = os.path.splitext(velocity_file)
+    return f"{base}.{digest}.parquet"
+
+
+def _write_parquet_mirror(df: pd.DataFrame, mirror: str):
+    """Write the Parquet mirror and drop mirrors of older workbook versions."""
+    base = mirror.rsplit('.', 2)[0]
+    # Only names of the exact <stem>.<16 hex>.parquet shape are ours
+    for stale in glob.glob(glob.escape(base) + '.' + '[0-9a-f]' * 16 + '.parquet'):
+        if stale != mirror:
+            os.remove(stale)
+    df.to_parquet(mirror, engine='pyarrow', compression='zstd', index=False)
 
 
 def read_velocity_trends(velocity_file: str) -> pd.DataFrame:
     """
     Read Velocity Trends file - Detail Data sheet
     
+    Repeat reads of an unchanged workbook within the same process return the
+    same DataFrame; callers treat it as read-only.
+    
     Returns:
         DataFrame with Prime Item level data
     """
-    print("\n📊 Reading Velocity Trends File...")
+    logger.info("📊 Reading Velocity Trends File...")
     
-    df = pd.read_excel(velocity_file, sheet_name='Detail Data', header=1)
+    if not os.path.isfile(velocity_file):
+        return _read_velocity_raw(velocity_file)
     
-    print(f"   ✓ {len(df)} Prime Items (size/color level)")
+    st = os.stat(velocity_file)
+    hits = _read_velocity_cached.cache_info().hits
+    df = _read_velocity_cached(os.path.abspath(velocity_file), st.st_mtime_ns, st.st_size)
+    if _read_velocity_cached.cache_info().hits > hits:
+        logger.info("   ⚡ Reused in-process copy (%d Prime Items)", len(df))
+    return df
+
+
+@functools.lru_cache(maxsize=4)
+def _read_velocity_cached(velocity_file: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """``_read_velocity_raw`` memoized on the workbook's path, mtime and size."""
+    return _read_velocity_raw(velocity_file)
+
+
+def _read_velocity_raw(velocity_file: str) -> pd.DataFrame:
+    """Load the Detail Data sheet from the Parquet mirror or the workbook."""
+    mirror = None
+    if pyarrow is not None and os.path.exists(velocity_file):
+        mirror = _parquet_mirror_path(velocity_file)
+        if os.path.exists(mirror):
+            try:
+                df = pd.read_parquet(mirror, engine='pyarrow')
+                logger.info("   ⚡ Loaded from Parquet mirror (%s)", os.path.basename(mirror))
+                logger.info("   ✓ %d Prime Items (size/color level)", len(df))
+                return df
+            except Exception as e:
+                logger.warning("   ⚠️ Ignoring unreadable Parquet mirror %s (%s)", mirror, e)
+    
+    # Callable usecols: a column missing from an older export is simply absent
+    # instead of failing the read
+    df = pd.read_excel(
+        velocity_file,
+        sheet_name='Detail Data',
+        header=1,
+        engine=EXCEL_ENGINE,
+        usecols=lambda col: col in VELOCITY_COLUMNS,
+        dtype=VELOCITY_TEXT_DTYPES,
+    )
+    
+    if mirror is not None:
+        try:
+            _write_parquet_mirror(df, mirror)
+        except Exception as e:
+            logger.warning("   ⚠️ Could not write Parquet mirror (%s)", e)
+    
+    logger.info("   ✓ %d Prime Items (size/color level)", len(df))
     
     return df
 
 
-def map_velocity_to_styles(velocity_df: pd.DataFrame) -> Dict[str, List[Dict]]:
+class PrimeItem(NamedTuple):
+    """One Velocity Trends Detail Data row, attached to its Style/Color."""
+    prime_item: int
+    size: str
+    item_status: str
+    lw_pos_qty: float
+    lw_inv_units: float
+    lw_inv_retail: float
+    wos: float
+    curr_valid_stores: int
+    unit_retail: float
+    unit_cost: float
+
+
+def _prime_item_metrics(lw_pos_qty: np.ndarray, lw_inv_retail: np.ndarray,
+                        lw_avg_retail: np.ndarray):
+    """
+    Inventory units and WOS for float64 Prime Item columns.
+
+    An avg retail of 0 is treated as 1; a blank or negative one yields 0
+    units. WOS is 0 where nothing sold. Each division only runs on the rows
+    it applies to, writing into a zero-filled output.
+    """
+    lw_avg_retail = np.where(lw_avg_retail == 0, 1.0, lw_avg_retail)  # Avoid division by zero
+    
+    # Calculate inventory in units (retail $ / avg retail)
+    lw_inv_units = np.divide(lw_inv_retail, lw_avg_retail,
+                             out=np.zeros_like(lw_inv_retail), where=lw_avg_retail > 0)
+    
+    # Calculate WOS
+    wos = np.divide(lw_inv_units, lw_pos_qty, out=np.zeros_like(lw_inv_units), where=lw_pos_qty > 0)
+    
+    return lw_inv_units, wos
+
+
+def map_velocity_to_styles(velocity_df: pd.DataFrame) -> Dict[str, List[PrimeItem]]:
     """
     Map Prime Items to Style/Color codes
     
@@ -34,69 +214,159 @@ def map_velocity_to_styles(velocity_df: pd.DataFrame) -> Dict[str, List[Dict]]:
         Dictionary mapping Style/Color to list of Prime Items
         {
             'EU1939RBD': [
-                {'prime_item': 574680967, 'size': '32X32', 'status': 'A', 'wos': 12.5, ...},
-                {'prime_item': 574680949, 'size': '34X32', 'status': 'A', 'wos': 8.3, ...},
+                PrimeItem(prime_item=574680967, size='32X32', item_status='A', ..., wos=12.5, ...),
+                PrimeItem(prime_item=574680949, size='34X32', item_status='A', ..., wos=8.3, ...),
             ],
             ...
         }
     """
-    print("\n🔗 Mapping Velocity Data to Style/Color codes...")
+    logger.info("🔗 Mapping Velocity Data to Style/Color codes...")
     
     style_map = {}
     
-    for idx, row in velocity_df.iterrows():
-        # Vndr Category 2 contains the Style/Color code
-        style_color = str(row.get('Vndr Category 2', '')).strip()
-        
-        if not style_color or pd.isna(style_color):
-            continue
-        
-        # Extract key metrics
-        prime_item = row.get('Prime Item Nbr', '')
-        size = str(row.get('Prime Size Description', '')).strip()
-        item_status = str(row.get('Item Status', '')).strip()
-        
-        # Sales and inventory
-        lw_pos_qty = row.get('LW POS Qty', 0) or 0
-        lw_inv_retail = row.get('Total LW Str Inv Retail', 0) or 0
-        lw_avg_retail = row.get('LW Avg Retail', 0) or 1  # Avoid division by zero
-        
-        # Calculate inventory in units (retail $ / avg retail)
-        lw_inv_units = lw_inv_retail / lw_avg_retail if lw_avg_retail > 0 else 0
-        
-        # Calculate WOS
-        wos = (lw_inv_units / lw_pos_qty) if lw_pos_qty > 0 else 0
-        
+    # Vndr Category 2 contains the Style/Color code. Rows without one can't
+    # be mapped, so they're dropped before anything else is computed.
+    style_color = _text_column(velocity_df, 'Vndr Category 2')
+    mapped = (style_color != '').to_numpy()
+    if not mapped.all():
+        velocity_df = velocity_df[mapped]
+        style_color = style_color[mapped]
+    
+    # Per-row metrics as whole-column NumPy expressions
+    size = _text_column(velocity_df, 'Prime Size Description')
+    item_status = _text_column(velocity_df, 'Item Status')
+    
+    # Sales and inventory (missing cells count as 0)
+    lw_pos_qty = _num_column(velocity_df, 'LW POS Qty')
+    lw_inv_retail = _num_column(velocity_df, 'Total LW Str Inv Retail')
+    lw_avg_retail = _num_column(velocity_df, 'LW Avg Retail', fill=np.nan)
+    lw_inv_units, wos = _prime_item_metrics(lw_pos_qty, lw_inv_retail, lw_avg_retail)
+    
+    records = pd.DataFrame({
+        'prime_item': velocity_df['Prime Item Nbr'] if 'Prime Item Nbr' in velocity_df else '',
+        'size': size,
+        'item_status': item_status,
+        'lw_pos_qty': lw_pos_qty,
+        'lw_inv_units': lw_inv_units,
+        'lw_inv_retail': lw_inv_retail,
+        'wos': _round(wos, 1),
         # Store count
-        curr_valid_stores = row.get('Curr Valid Stores', 0) or 0
-        
+        'curr_valid_stores': _num_column(velocity_df, 'Curr Valid Stores').astype(np.int32),
+        'unit_retail': _num_column(velocity_df, 'Unit Retail'),
+        'unit_cost': _num_column(velocity_df, 'Unit Cost'),
+    })
+    
+    # Plain tuples in column order; the style code rides alongside so each
+    # row is passed to PrimeItem._make() as-is, without slicing
+    for style, row in zip(style_color.tolist(), records.itertuples(index=False, name=None)):
         # Build Prime Item record
-        prime_item_record = {
-            'prime_item': prime_item,
-            'size': size,
-            'item_status': item_status,
-            'lw_pos_qty': float(lw_pos_qty),
-            'lw_inv_units': float(lw_inv_units),
-            'lw_inv_retail': float(lw_inv_retail),
-            'wos': round(float(wos), 1),
-            'curr_valid_stores': int(curr_valid_stores),
-            'unit_retail': float(row.get('Unit Retail', 0) or 0),
-            'unit_cost': float(row.get('Unit Cost', 0) or 0),
-        }
+        prime_item_record = PrimeItem._make(row)
         
-        # Add to style map
-        if style_color not in style_map:
-            style_map[style_color] = []
-        
-        style_map[style_color].append(prime_item_record)
+        # Add to style map (one hashed lookup per row)
+        style_map.setdefault(style, []).append(prime_item_record)
     
-    print(f"   ✓ Mapped {len(style_map)} Style/Color codes")
-    print(f"   ✓ Total Prime Items: {sum(len(v) for v in style_map.values())}")
+    logger.info("   ✓ Mapped %d Style/Color codes", len(style_map))
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("   ✓ Total Prime Items: %d", sum(len(v) for v in style_map.values()))
     
     return style_map
 
 
-def enrich_sku_master_with_size_analysis(sku_master: List[Dict], style_map: Dict[str, List[Dict]]) -> List[Dict]:
+# Prime Item fields read by _size_stats, packed into one record per item.
+# Counts fit comfortably in int32; WOS and sales stay float64 because they
+# are averaged and published, and float32 would surface as 2.0999999 etc.
+_SIZE_FIELDS = np.dtype([
+    ('active', np.bool_),
+    ('curr_valid_stores', np.int32),
+    ('wos', np.float64),
+    ('lw_pos_qty', np.float64),
+    ('lw_inv_units', np.float64),
+])
+
+
+def _size_stats(style_map: Dict[str, List[PrimeItem]]) -> pd.DataFrame:
+    """
+    Per-style size metrics, one row per ``style_map`` key in key order.
+
+    The columns are the ``size_analysis`` fields, already rounded for
+    display. The WOS statistics only consider sizes with a positive WOS
+    (0 where a style has none).
+    """
+    counts = np.fromiter((len(items) for items in style_map.values()), dtype=np.int64, count=len(style_map))
+    
+    # A single streaming pass over every Prime Item fills all the fields.
+    # Items of a style are contiguous, so each style is one segment
+    # starting at its offset.
+    fields = np.fromiter(
+        (
+            (p.item_status == 'A', p.curr_valid_stores, p.wos, p.lw_pos_qty, p.lw_inv_units)
+            for p in chain.from_iterable(style_map.values())
+        ),
+        dtype=_SIZE_FIELDS,
+        count=int(counts.sum()),
+    )
+    wos = fields['wos']
+    pos_qty = fields['lw_pos_qty']
+    inv_units = fields['lw_inv_units']
+    has_wos = wos > 0
+    
+    # Identify productive vs. dead sizes
+    masks = {
+        'active_items': fields['active'],
+        'productive_sizes': (pos_qty > 0) & (wos < 20),
+        'dead_sizes': (wos > 30) | ((pos_qty == 0) & (inv_units > 0)),
+        'wos_count': has_wos,
+    }
+    
+    # reduceat misreads empty segments, so only non-empty styles are reduced
+    # and the results are scattered back (styles with no items keep 0)
+    nonempty = counts > 0
+    starts = (np.cumsum(counts) - counts)[nonempty]
+    
+    def segment(ufunc, values, dtype):
+        out = np.zeros(len(counts), dtype=dtype)
+        if len(starts):
+            out[nonempty] = ufunc.reduceat(values, starts)
+        return out
+    
+    sums = {name: segment(np.add, mask.view(np.uint8).astype(np.int32), np.int32)
+            for name, mask in masks.items()}
+    
+    wos_count = sums.pop('wos_count')
+    # reduceat doesn't add in sum() order, so each style's positive WOS values
+    # go through the builtin sum() in item order and round exactly as before
+    positive = iter(wos[has_wos].tolist())
+    wos_sum = np.fromiter((sum(islice(positive, n)) for n in wos_count.tolist()),
+                          dtype=np.float64, count=len(counts))
+    max_wos = segment(np.maximum, np.where(has_wos, wos, -np.inf), np.float64)
+    min_wos = segment(np.minimum, np.where(has_wos, wos, np.inf), np.float64)
+    
+    # The WOS statistics are 0 where a style has no positive WOS
+    none = wos_count == 0
+    stats = pd.DataFrame({
+        'total_prime_items': counts,
+        'active_items': sums['active_items'],
+        # Use max instead of sum to get actual store count (sizes are in same stores)
+        'total_stores': segment(np.maximum, fields['curr_valid_stores'], np.int32),
+        'avg_wos': np.divide(wos_sum, wos_count, out=np.zeros(len(counts)), where=~none),
+        'max_wos': np.where(none, 0.0, max_wos),
+        'min_wos': np.where(none, 0.0, min_wos),
+        'productive_sizes': sums['productive_sizes'],
+        'dead_sizes': sums['dead_sizes'],
+    })
+    
+    total = stats['total_prime_items'].to_numpy()
+    efficiency = np.divide(stats['productive_sizes'].to_numpy(), total,
+                           out=np.zeros(len(total)), where=total > 0)
+    stats['size_efficiency_pct'] = efficiency * 100
+    
+    # Round once for display, one column at a time
+    for col in ('avg_wos', 'max_wos', 'min_wos', 'size_efficiency_pct'):
+        stats[col] = _round(stats[col].to_numpy(), 1)
+    return stats
+
+
+def enrich_sku_master_with_size_analysis(sku_master: List[Dict], style_map: Dict[str, List[PrimeItem]]) -> List[Dict]:
     """
     Enrich SKU master with size-level analysis from Velocity Trends
     
@@ -107,60 +377,44 @@ def enrich_sku_master_with_size_analysis(sku_master: List[Dict], style_map: Dict
     Returns:
         Enriched SKU master with size analysis
     """
-    print("\n💎 Enriching SKU Master with Size Analysis...")
+    logger.info("💎 Enriching SKU Master with Size Analysis...")
+    
+    # Size-level metrics for every style at once: flatten the Prime Items
+    # into columns and reduce each style's contiguous segment
+    stats = _size_stats(style_map)
+    
+    # Join SKU codes to the style stats in one vectorized lookup (the stats
+    # position for each SKU, -1 where the style has no velocity data)
+    styles = pd.Index(list(style_map), dtype=object)
+    codes = pd.Index([sku.get('sku', '') for sku in sku_master], dtype=object)
+    positions = styles.get_indexer(codes)
+    
+    # Still one row per style; dicts are only built for matching SKUs
+    analysis_keys = tuple(stats.columns)
+    analysis_rows = list(stats.itertuples(index=False, name=None))
+    prime_item_lists = list(style_map.values())
     
     enriched_count = 0
     
-    for sku in sku_master:
-        sku_code = sku.get('sku', '')
-        
+    for sku, pos in zip(sku_master, positions.tolist()):
         # Initialize store_count to 0 (will be updated if velocity data exists)
         sku['store_count'] = 0
         
-        if sku_code in style_map:
-            prime_items = style_map[sku_code]
-            
-            # Calculate size-level metrics
-            total_prime_items = len(prime_items)
-            active_items = [p for p in prime_items if p['item_status'] == 'A']
-            # Use max instead of sum to get actual store count (sizes are in same stores)
-            total_stores = max(p['curr_valid_stores'] for p in prime_items) if prime_items else 0
-            
-            # WOS distribution
-            wos_values = [p['wos'] for p in prime_items if p['wos'] > 0]
-            avg_wos = sum(wos_values) / len(wos_values) if wos_values else 0
-            max_wos = max(wos_values) if wos_values else 0
-            min_wos = min(wos_values) if wos_values else 0
-            
-            # Sales distribution
-            total_sales = sum(p['lw_pos_qty'] for p in prime_items)
-            
-            # Identify productive vs. dead sizes
-            productive_sizes = [p for p in prime_items if p['lw_pos_qty'] > 0 and p['wos'] < 20]
-            dead_sizes = [p for p in prime_items if p['wos'] > 30 or (p['lw_pos_qty'] == 0 and p['lw_inv_units'] > 0)]
-            
-            # Add size analysis to SKU record
-            sku['size_analysis'] = {
-                'total_prime_items': total_prime_items,
-                'active_items': len(active_items),
-                'total_stores': total_stores,
-                'avg_wos': round(avg_wos, 1),
-                'max_wos': round(max_wos, 1),
-                'min_wos': round(min_wos, 1),
-                'productive_sizes': len(productive_sizes),
-                'dead_sizes': len(dead_sizes),
-                'size_efficiency_pct': round((len(productive_sizes) / total_prime_items * 100), 1) if total_prime_items > 0 else 0,
-            }
-            
-            # Flatten store_count to top level for dashboard display
-            sku['store_count'] = total_stores
-            
-            # Store Prime Item details
-            sku['prime_items'] = prime_items
-            
-            enriched_count += 1
-    
-    print(f"   ✓ Enriched {enriched_count} SKUs with size analysis")
+        if pos < 0:
+            continue
+        
+        # Add size analysis to SKU record
+        sku['size_analysis'] = size_analysis = dict(zip(analysis_keys, analysis_rows[pos]))
+        
+        # Flatten store_count to top level for dashboard display
+        sku['store_count'] = size_analysis['total_stores']
+        
+        # Store Prime Item details (as dicts, so they serialize as objects)
+        sku['prime_items'] = [p._asdict() for p in prime_item_lists[pos]]
+        
+        enriched_count += 1
+    
+    logger.info("   ✓ Enriched %d SKUs with size analysis", enriched_count)
     
     return sku_master
 
@@ -175,33 +429,36 @@ def generate_size_recommendations(sku_master: List[Dict]) -> List[Dict]:
     Returns:
         List of size optimization recommendations
     """
-    print("\n📋 Generating Size Optimization Recommendations...")
+    logger.info("📋 Generating Size Optimization Recommendations...")
+    
+    # Recommendation logic as one vectorized filter over the analysed SKUs
+    analysed = [sku for sku in sku_master if 'size_analysis' in sku]
+    n = len(analysed)
+    dead = np.fromiter((sku['size_analysis'].get('dead_sizes', 0) for sku in analysed),
+                       dtype=np.int32, count=n)
+    efficiency = np.fromiter((sku['size_analysis'].get('size_efficiency_pct', 0) for sku in analysed),
+                             dtype=np.float64, count=n)
+    selected = np.flatnonzero((dead > 0) & (efficiency < 70))
+    priorities = np.where(dead[selected] > 3, 'high', 'medium').tolist()
     
     recommendations = []
     
-    for sku in sku_master:
-        if 'size_analysis' not in sku:
-            continue
-        
+    for i, priority in zip(selected.tolist(), priorities):
+        sku = analysed[i]
         size_analysis = sku['size_analysis']
         dead_sizes = size_analysis.get('dead_sizes', 0)
-        size_efficiency = size_analysis.get('size_efficiency_pct', 0)
-        
-        # Recommendation logic
-        if dead_sizes > 0 and size_efficiency < 70:
-            recommendation = {
-                'sku': sku['sku'],
-                'fineline': sku['fineline'],
-                'tier': sku['tier'],
-                'total_sizes': size_analysis['total_prime_items'],
-                'dead_sizes': dead_sizes,
-                'size_efficiency_pct': size_efficiency,
-                'recommendation': f"Optimize size curve - {dead_sizes} dead sizes out of {size_analysis['total_prime_items']}",
-                'priority': 'high' if dead_sizes > 3 else 'medium',
-                'expected_impact': 'Reduce inventory bloat, improve WOS'
-            }
-            recommendations.append(recommendation)
-    
-    print(f"   ✓ Generated {len(recommendations)} size optimization recommendations")
+        recommendations.append({
+            'sku': sku['sku'],
+            'fineline': sku['fineline'],
+            'tier': sku['tier'],
+            'total_sizes': size_analysis['total_prime_items'],
+            'dead_sizes': dead_sizes,
+            'size_efficiency_pct': size_analysis.get('size_efficiency_pct', 0),
+            'recommendation': f"Optimize size curve - {dead_sizes} dead sizes out of {size_analysis['total_prime_items']}",
+            'priority': priority,
+            'expected_impact': 'Reduce inventory bloat, improve WOS'
+        })
+    
+    logger.info("   ✓ Generated %d size optimization recommendations", len(recommendations))
     
     return recommendations